@@ -19,6 +19,7 @@ from core.dependency_injection.providers import (
     get_create_dummy_camera_images_use_case
 )
 
+from core.api.base_client import close_shared_session
 from core.session_manager import get_session_manager
 
 from ..utils.input_helpers import select_installation
@@ -74,6 +75,8 @@ class BaseCommand(ABC):
         """Clean up resources."""
         session_manager = get_session_manager()
         await session_manager.cleanup()
+        # Release pooled HTTP connections before the event loop shuts down
+        await close_shared_session()
 
     def get_installation_id(
         self, installation_id: Optional[str] = None
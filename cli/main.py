@@ -17,6 +17,7 @@ from .commands.alarm import AlarmCommand
 from .commands.cameras import CameraCommand
 from .utils.display import print_header, print_error, print_info
 from core.session_manager import get_session_manager
+from core.api.base_client import close_shared_session
 
 logger = logging.getLogger(__name__)
 
@@ -288,6 +289,10 @@ async def main():
         await session_manager.cleanup()
         return 1
 
+    finally:
+        # Release pooled HTTP connections before asyncio.run closes the loop
+        await close_shared_session()
+
 
 if __name__ == "__main__":
     exit_code = asyncio.run(main())
@@ -39,7 +39,8 @@ class MyVerisureAlarmControlPanel(AlarmControlPanelEntity):
     ) -> None:
         """Initialize the alarm control panel."""
         self.coordinator = coordinator
-        self.config_entry = config_entry
+        # The installation never changes for an entry, so resolve it once
+        self._installation_id = config_entry.data.get("installation_id")
         # Use a simple name and unique_id
         self._attr_name = ENTITY_NAMES["alarm_control_panel"]
         self._attr_unique_id = "my_verisure"
@@ -207,7 +208,7 @@ class MyVerisureAlarmControlPanel(AlarmControlPanelEntity):
         self.async_write_ha_state()
         
         try:
-            installation_id = self.config_entry.data.get("installation_id")
+            installation_id = self._installation_id
             if installation_id:
                 # Use the service instead of calling coordinator directly
                 # This prevents double execution
@@ -239,7 +240,7 @@ class MyVerisureAlarmControlPanel(AlarmControlPanelEntity):
         self.async_write_ha_state()
 
         try:
-            installation_id = self.config_entry.data.get("installation_id")
+            installation_id = self._installation_id
             if installation_id:
                 # Use the service instead of calling coordinator directly
                 await self.hass.services.async_call(
@@ -269,7 +270,7 @@ class MyVerisureAlarmControlPanel(AlarmControlPanelEntity):
         self.async_write_ha_state()
 
         try:
-            installation_id = self.config_entry.data.get("installation_id")
+            installation_id = self._installation_id
             if installation_id:
                 # Use the service instead of calling coordinator directly
                 await self.hass.services.async_call(
@@ -299,7 +300,7 @@ class MyVerisureAlarmControlPanel(AlarmControlPanelEntity):
         self.async_write_ha_state()
 
         try:
-            installation_id = self.config_entry.data.get("installation_id")
+            installation_id = self._installation_id
             if installation_id:
                 # Use the service instead of calling coordinator directly
                 await self.hass.services.async_call(
@@ -27,10 +27,8 @@ async def async_setup_entry(
         config_entry.entry_id
     ]
 
-    entities = []
-
     # Create alarm status binary sensors
-    entities.extend([
+    async_add_entities([
         # Binary sensor for internal day alarm
         MyVerisureAlarmBinarySensor(
             coordinator,
@@ -65,8 +63,6 @@ async def async_setup_entry(
         ),
     ])
 
-    async_add_entities(entities)
-
 
 class MyVerisureAlarmBinarySensor(BinarySensorEntity):
     """Representation of My Verisure alarm binary sensor."""
@@ -81,8 +77,9 @@ class MyVerisureAlarmBinarySensor(BinarySensorEntity):
     ) -> None:
         """Initialize the alarm binary sensor."""
         self.coordinator = coordinator
-        self.config_entry = config_entry
         self.sensor_id = sensor_id
+        # The installation never changes for an entry, so resolve it once
+        self._installation_id = config_entry.data.get("installation_id", "Unknown")
 
         self._attr_name = friendly_name
         self._attr_unique_id = f"{config_entry.entry_id}_alarm_{sensor_id}"
@@ -95,10 +92,11 @@ class MyVerisureAlarmBinarySensor(BinarySensorEntity):
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
 
-        alarm_status = self.coordinator.data.get("alarm_status", {})
+        alarm_status = data.get("alarm_status", {})
         if not alarm_status:
             return None
 
@@ -126,17 +124,18 @@ class MyVerisureAlarmBinarySensor(BinarySensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return {}
 
-        alarm_status = self.coordinator.data.get("alarm_status", {})
+        alarm_status = data.get("alarm_status", {})
         if not alarm_status:
             return {}
 
         return {
             "sensor_type": self.sensor_id,
-            "installation_id": self.config_entry.data.get("installation_id", "Unknown"),
-            "last_updated": self.coordinator.data.get("last_updated"),
+            "installation_id": self._installation_id,
+            "last_updated": data.get("last_updated"),
         }
 
     @property
@@ -4,7 +4,7 @@ import logging
 import os
 import secrets
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
 from homeassistant.components.camera import Camera
 from homeassistant.core import HomeAssistant
@@ -14,10 +14,89 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .core.file_manager import get_file_manager
 from .core.const import DOMAIN
 from .coordinator import MyVerisureDataUpdateCoordinator
-from .core.dependency_injection.providers import setup_dependencies, clear_dependencies
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device types that are cameras
+_CAMERA_TYPES = frozenset({"YP", "YR"})
+
+
+def _read_latest_image(device_path: str) -> Optional[Tuple[bytes, str, str]]:
+    """Read the newest image under a camera directory.
+
+    Returns the image bytes, the file path and the capture timestamp, or None
+    when there is no image. Only touches the filesystem, so it is safe to run
+    in the executor.
+    """
+    try:
+        _LOGGER.debug("Looking for camera images in: %s", device_path)
+
+        if not os.path.exists(device_path):
+            _LOGGER.warning("Camera directory not found: %s", device_path)
+            return None
+
+        # List all items in the camera directory
+        try:
+            items = os.listdir(device_path)
+            _LOGGER.debug("Found %d items in camera directory: %s", len(items), items)
+        except Exception as e:
+            _LOGGER.error("Error listing camera directory %s: %s", device_path, e)
+            return None
+
+        # Find the most recent timestamp directory
+        latest_timestamp = None
+        latest_timestamp_dir = None
+
+        for item in items:
+            item_path = os.path.join(device_path, item)
+            if os.path.isdir(item_path):
+                try:
+                    # Parse timestamp from directory name (format: 2025-01-16_06-10-44)
+                    # Convert "2025-01-16_06-10-44" to "2025-01-16 06:10:44"
+                    timestamp_str = item.replace("_", " ")
+                    timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H-%M-%S")
+
+                    if latest_timestamp is None or timestamp > latest_timestamp:
+                        latest_timestamp = timestamp
+                        latest_timestamp_dir = item_path
+                        _LOGGER.debug("Found newer timestamp directory: %s (parsed as %s)", item, timestamp)
+                except ValueError as e:
+                    _LOGGER.debug("Could not parse timestamp from directory '%s': %s", item, e)
+                    continue
+
+        if latest_timestamp_dir is None:
+            _LOGGER.warning("No valid timestamp directories found in %s", device_path)
+            return None
+
+        _LOGGER.debug("Using latest timestamp directory: %s", latest_timestamp_dir)
+
+        # Look for thumbnail.jpg in the latest directory
+        thumbnail_path = os.path.join(latest_timestamp_dir, "thumbnail.jpg")
+        if os.path.exists(thumbnail_path):
+            with open(thumbnail_path, "rb") as f:
+                return f.read(), thumbnail_path, latest_timestamp.isoformat()
+
+        # Try to find any image file in the directory
+        try:
+            files = os.listdir(latest_timestamp_dir)
+            _LOGGER.debug("Files in latest directory: %s", files)
+
+            # Look for any image file
+            for file in files:
+                if file.lower().endswith(('.jpg', '.jpeg', '.png')):
+                    image_path = os.path.join(latest_timestamp_dir, file)
+                    with open(image_path, "rb") as f:
+                        return f.read(), image_path, latest_timestamp.isoformat()
+        except Exception as e:
+            _LOGGER.error("Error reading files from directory %s: %s", latest_timestamp_dir, e)
+
+        _LOGGER.warning("No thumbnail.jpg or other images found in latest directory: %s", latest_timestamp_dir)
+        return None
+
+    except Exception as e:
+        _LOGGER.error("Error getting latest image from %s: %s", device_path, e)
+        return None
+
 
 class VerisureCamera(CoordinatorEntity, Camera):
     """Camera entity for Verisure cameras."""
@@ -50,97 +129,30 @@ class VerisureCamera(CoordinatorEntity, Camera):
     @property
     def camera_image(self) -> Optional[bytes]:
         """Return the latest camera image."""
-        return self._get_latest_image()
-
-    def _get_latest_image(self) -> Optional[bytes]:
-        """Get the most recent image for this camera."""
         try:
-            setup_dependencies()
-            
-            # Get the camera directory path
-            camera_dir = get_file_manager().get_data_directory()
-            device_path = os.path.join(camera_dir, "cameras", f"{self._device['type']}{int(self._device['code']):02d}")
-            
-            _LOGGER.debug("Looking for camera images in: %s", device_path)
-        
-            if not os.path.exists(device_path):
-                _LOGGER.warning("Camera directory not found: %s", device_path)
-                return None
-
-            # List all items in the camera directory
-            try:
-                items = os.listdir(device_path)
-                _LOGGER.debug("Found %d items in camera directory: %s", len(items), items)
-            except Exception as e:
-                _LOGGER.error("Error listing camera directory %s: %s", device_path, e)
-                return None
-
-            # Find the most recent timestamp directory
-            latest_timestamp = None
-            latest_timestamp_dir = None
-            
-            for item in items:
-                item_path = os.path.join(device_path, item)
-                if os.path.isdir(item_path):
-                    try:
-                        # Parse timestamp from directory name (format: 2025-01-16_06-10-44)
-                        # Convert "2025-01-16_06-10-44" to "2025-01-16 06:10:44"
-                        timestamp_str = item.replace("_", " ")
-                        timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H-%M-%S")
-                        
-                        if latest_timestamp is None or timestamp > latest_timestamp:
-                            latest_timestamp = timestamp
-                            latest_timestamp_dir = item_path
-                            _LOGGER.debug("Found newer timestamp directory: %s (parsed as %s)", item, timestamp)
-                    except ValueError as e:
-                        _LOGGER.debug("Could not parse timestamp from directory '%s': %s", item, e)
-                        continue
-
-            if latest_timestamp_dir is None:
-                _LOGGER.warning("No valid timestamp directories found for camera %s in %s", self._device['code'], device_path)
-                return None
-
-            _LOGGER.debug("Using latest timestamp directory: %s", latest_timestamp_dir)
-
-            # Look for thumbnail.jpg in the latest directory
-            thumbnail_path = os.path.join(latest_timestamp_dir, "thumbnail.jpg")
-            if os.path.exists(thumbnail_path):
-                with open(thumbnail_path, "rb") as f:
-                    image_data = f.read()
-                    self._latest_image_path = thumbnail_path
-                    self._latest_image_timestamp = latest_timestamp.isoformat()
-                    _LOGGER.info("✅ Loaded latest image for camera %s from %s (size: %d bytes)", 
-                               self._device['code'], thumbnail_path, len(image_data))
-                    return image_data
-            else:
-                # Try to find any image file in the directory
-                try:
-                    files = os.listdir(latest_timestamp_dir)
-                    _LOGGER.debug("Files in latest directory: %s", files)
-                    
-                    # Look for any image file
-                    for file in files:
-                        if file.lower().endswith(('.jpg', '.jpeg', '.png')):
-                            image_path = os.path.join(latest_timestamp_dir, file)
-                            with open(image_path, "rb") as f:
-                                image_data = f.read()
-                                self._latest_image_path = image_path
-                                self._latest_image_timestamp = latest_timestamp.isoformat()
-                                _LOGGER.info("✅ Loaded image for camera %s from %s (size: %d bytes)", 
-                                           self._device['code'], image_path, len(image_data))
-                                return image_data
-                except Exception as e:
-                    _LOGGER.error("Error reading files from directory %s: %s", latest_timestamp_dir, e)
-                
-                _LOGGER.warning("No thumbnail.jpg or other images found in latest directory: %s", latest_timestamp_dir)
-                return None
-                
+            device_path = self._device_path()
         except Exception as e:
             _LOGGER.error("Error getting latest image for camera %s: %s", self._device['code'], e)
             return None
-        finally:
-            # Clean up dependencies
-            clear_dependencies()
+        return self._store_latest_image(_read_latest_image(device_path))
+
+    def _device_path(self) -> str:
+        """Return the directory holding this camera's image captures."""
+        camera_dir = get_file_manager().get_data_directory()
+        return os.path.join(camera_dir, "cameras", f"{self._device['type']}{int(self._device['code']):02d}")
+
+    def _store_latest_image(
+        self, latest: Optional[Tuple[bytes, str, str]]
+    ) -> Optional[bytes]:
+        """Record where the latest image came from and return its bytes."""
+        if latest is None:
+            return None
+        image_data, image_path, timestamp = latest
+        self._latest_image_path = image_path
+        self._latest_image_timestamp = timestamp
+        _LOGGER.info("✅ Loaded latest image for camera %s from %s (size: %d bytes)",
+                   self._device['code'], image_path, len(image_data))
+        return image_data
 
     @property
     def extra_state_attributes(self):
@@ -159,8 +171,17 @@ class VerisureCamera(CoordinatorEntity, Camera):
         """Return the latest camera image asynchronously.
 
         Width and height are ignored because this camera only serves static images.
+        The directory scan and file read run in the executor so they do not
+        block the event loop.
         """
-        return self._get_latest_image()
+        try:
+            device_path = self._device_path()
+        except Exception as e:
+            _LOGGER.error("Error getting latest image for camera %s: %s", self._device['code'], e)
+            return None
+        return self._store_latest_image(
+            await self.hass.async_add_executor_job(_read_latest_image, device_path)
+        )
 
     @property
     def supported_features(self) -> int:
@@ -234,7 +255,7 @@ async def async_setup_entry(
     # Filter for camera devices (YP and YR)
     camera_devices = [
         device for device in devices 
-        if device.get('type') in ["YP", "YR"]
+        if device.get('type') in _CAMERA_TYPES
     ]
     
     for device in camera_devices:
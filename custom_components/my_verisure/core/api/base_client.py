@@ -1,9 +1,10 @@
 """Base client for My Verisure GraphQL API."""
 
+import asyncio
 import json
 import logging
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 import aiohttp
 
@@ -12,6 +13,70 @@ from .exceptions import MyVerisureServiceBlockedError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound of pooled connections kept by the shared HTTP session
+_MAX_CONNECTIONS = 16
+
+# One HTTP session shared by every API client, so consecutive queries reuse
+# keep-alive connections instead of paying a new TCP and TLS handshake. It is
+# bound to the event loop that created it.
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+# Close tasks for sessions replaced after an event loop change, kept
+# referenced until they finish
+_closing_tasks: Set["asyncio.Future[None]"] = set()
+
+
+def _discard_session(
+    session: aiohttp.ClientSession,
+    session_loop: Optional[asyncio.AbstractEventLoop],
+    loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Close a shared session that belongs to a previous event loop."""
+    if session.closed:
+        return
+    if session_loop is not None and session_loop.is_running():
+        # Its connections live on that loop, so close it there
+        asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+        return
+    # The old loop is gone: closing only marks the session and connector as
+    # closed, which is safe to do from the current loop
+    task = loop.create_task(session.close())
+    _closing_tasks.add(task)
+    task.add_done_callback(_closing_tasks.discard)
+
+
+def _get_shared_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use."""
+    global _shared_session, _shared_session_loop
+    loop = asyncio.get_running_loop()
+    if (
+        _shared_session is None
+        or _shared_session.closed
+        or _shared_session_loop is not loop
+    ):
+        if _shared_session is not None:
+            _discard_session(_shared_session, _shared_session_loop, loop)
+        # No cookie jar: the session outlives single queries and is shared by
+        # every account, so cookies must not carry over between requests
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=_MAX_CONNECTIONS),
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+        _shared_session_loop = loop
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """Close the shared HTTP session and its pooled connections."""
+    global _shared_session, _shared_session_loop
+    session = _shared_session
+    _shared_session = None
+    _shared_session_loop = None
+    if session is not None and not session.closed:
+        await session.close()
+
 
 class BaseClient:
     """Base client with HTTP and GraphQL functionality."""
@@ -73,8 +138,8 @@ class BaseClient:
     ) -> Dict[str, Any]:
         """Execute a GraphQL query using direct aiohttp request."""
         
-        _session = aiohttp.ClientSession()
-        
+        _session = _get_shared_session()
+
         try:
             request_data = {"query": query, "variables": variables or {}}
             request_headers = headers or self._get_headers()
@@ -100,7 +165,3 @@ class BaseClient:
         except Exception as e:
             _LOGGER.error("Direct GraphQL query failed: %s", e)
             return {"errors": [{"message": str(e), "data": {}}]}
-        finally:
-            if not _session.closed:
-                await _session.close()
-            _session = None
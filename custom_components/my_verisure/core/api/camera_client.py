@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import datetime
 import json
 
@@ -101,6 +101,15 @@ query mkGetPhotoImages($numinst: String!, $idSignal: String!, $signalType: Strin
 """
 
 
+def _status_poll_delay(
+    poll_schedule: Optional[List[float]], attempt: int, check_interval: int
+) -> float:
+    """Return the wait before the status poll that follows the given attempt."""
+    if poll_schedule and attempt <= len(poll_schedule):
+        return poll_schedule[attempt - 1]
+    return check_interval
+
+
 class CameraClient(BaseClient):
     """Client for camera operations."""
 
@@ -118,8 +127,13 @@ class CameraClient(BaseClient):
         capabilities: str,
         max_attempts: int = 30,
         check_interval: int = 20,
+        poll_schedule: Optional[List[float]] = None,
     ) -> CameraRequestImageResultDTO:
-        """Request images from cameras with automatic status checking."""
+        """Request images from cameras with automatic status checking.
+
+        poll_schedule optionally gives the waits between status polls; once it
+        is exhausted the polls fall back to check_interval.
+        """
         try:
             hash_token, session_data = self._get_current_credentials()
             
@@ -144,14 +158,14 @@ class CameraClient(BaseClient):
                 else None
             )
 
-            _LOGGER.warning("🔑 Headers for camera request: %s", json.dumps(headers, indent=2))
-
             if headers:
                 headers["numinst"] = installation_id
                 headers["panel"] = panel
                 headers["x-capabilities"] = capabilities
 
-            _LOGGER.warning("🔑 Headers for camera request after adding numinst, panel, and x-capabilities: %s", json.dumps(headers, indent=2))
+            # Serialising the headers is only worth it when DEBUG is on
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("🔑 Headers for camera request: %s", json.dumps(headers, indent=2))
 
                 # Step 1: Execute the first mutation with retry logic for "request_already_exists"
             reference_id = None
@@ -283,7 +297,9 @@ class CameraClient(BaseClient):
 
                 if not status_response:
                     if attempt < max_attempts:
-                        await asyncio.sleep(check_interval)
+                        await asyncio.sleep(
+                            _status_poll_delay(poll_schedule, attempt, check_interval)
+                        )
                         continue
                     else:
                         _LOGGER.warning("Max attempts reached for request_already_exists, continuing with status check")
@@ -322,14 +338,15 @@ class CameraClient(BaseClient):
                         reference_id=reference_id
                     )
                 else:
+                    delay = _status_poll_delay(poll_schedule, attempt, check_interval)
                     _LOGGER.info(
-                        "⏳ Images request still in progress. Status: %s, waiting %d seconds...",
+                        "⏳ Images request still in progress. Status: %s, waiting %.1f seconds...",
                         status,
-                        check_interval,
+                        delay,
                     )
                     
                     if attempt < max_attempts:
-                        await asyncio.sleep(check_interval)
+                        await asyncio.sleep(delay)
 
             # If we get here, we've exceeded max attempts
             _LOGGER.warning(
@@ -418,7 +435,10 @@ class CameraClient(BaseClient):
             if thumbnail_image:
                 device_dir = f"cameras/{zone_id}"
                 thumbnail_path = f"{device_dir}/{timestamp_dir}/thumbnail.jpg"
-                success = file_manager.save_base64_image(thumbnail_path, thumbnail_image)
+                # Decoding and writing block, so keep them off the event loop
+                success = await asyncio.to_thread(
+                    file_manager.save_base64_image, thumbnail_path, thumbnail_image
+                )
                 
                 if success:
                     _LOGGER.info("💾 Thumbnail saved to: %s", thumbnail_path)
@@ -475,7 +495,9 @@ class CameraClient(BaseClient):
                         image_filename = f"imagen_{image_id}.jpg"
                     
                     image_path = f"{device_dir}/{timestamp_dir}/{image_filename}"
-                    success = file_manager.save_base64_image(image_path, image_data)
+                    success = await asyncio.to_thread(
+                        file_manager.save_base64_image, image_path, image_data
+                    )
                     
                     if success:
                         _LOGGER.info("💾 Image %s saved to: %s", image_id, image_path)
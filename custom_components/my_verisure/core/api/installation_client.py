@@ -1,5 +1,6 @@
 """Installation client for My Verisure API."""
 
+import asyncio
 import logging
 from typing import List
 
@@ -235,20 +236,23 @@ class InstallationClient(BaseClient):
             if services_data and services_data.get("res") == "OK":
                 installation = services_data.get("installation", {})
 
-                deviceList = await self.get_installation_devices(
-                    installation_id,
-                    installation.get("panel", "Unknown"),
-                    installation.get("capabilities", "Unknown")
+                # The installation list does not depend on the panel, so fetch
+                # it alongside the devices instead of after them
+                deviceList, installations_dto = await asyncio.gather(
+                    self.get_installation_devices(
+                        installation_id,
+                        installation.get("panel", "Unknown"),
+                        installation.get("capabilities", "Unknown")
+                    ),
+                    self.get_installations(),
                 )
 
-                installations_dto = await self.get_installations()
-
                 _LOGGER.info("✅ Found %d devices for installation %s", len(deviceList.devices), installation_id)
 
-                for i in installations_dto:
-                    if i.numinst == installation_id:
-                        installation_dto = i
-                        break
+                installation_dto = next(
+                    (i for i in installations_dto if i.numinst == installation_id),
+                    None,
+                )
                 if not installation_dto:
                     raise MyVerisureError(f"Installation {installation_id} not found")
 
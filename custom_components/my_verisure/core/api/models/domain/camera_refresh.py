@@ -9,7 +9,7 @@ from datetime import datetime
 from .camera_refresh_data import CameraRefreshData
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraRefresh:
     """Domain model for camera refresh operation containing multiple camera refresh data."""
     
@@ -3,11 +3,9 @@ Domain models for camera refresh data.
 """
 
 from dataclasses import dataclass
-from typing import Optional
-from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraRefreshData:
     """Domain model for camera refresh data."""
     
@@ -6,7 +6,7 @@ from typing import Optional
 from ..dto.camera_request_image_dto import CameraRequestImageResultDTO, CameraRequestImageDTO, CameraRequestImageStatusDTO
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraRequestImage:
     """Domain model for camera image request."""
     
@@ -35,7 +35,7 @@ class CameraRequestImage:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraRequestImageStatus:
     """Domain model for camera status check."""
     
@@ -70,7 +70,7 @@ class CameraRequestImageStatus:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraRequestImageResult:
     """Domain model for camera image result."""
     
@@ -1,6 +1,7 @@
 """Device domain model for My Verisure API."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 
@@ -100,6 +101,11 @@ class Device:
         """Get display name for the device."""
         return self.name or f"{self.type} {self.code}"
     
+    @cached_property
+    def formatted_code(self) -> str:
+        """Get the camera identifier used by the API and image folders (e.g. YR01)."""
+        return f"{self.type}{int(self.code):02d}"
+    
     @property
     def is_remote_accessible(self) -> bool:
         """Check if device can be accessed remotely."""
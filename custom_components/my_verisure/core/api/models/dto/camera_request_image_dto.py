@@ -1,7 +1,7 @@
 """Camera Request Image DTOs for My Verisure API."""
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 
 @dataclass
@@ -1,7 +1,7 @@
 """Dependency injection container using injector."""
 
 import logging
-from typing import Optional, Type, TypeVar
+from typing import Any, Dict, Optional, Type, TypeVar
 from injector import Injector, Module
 
 logger = logging.getLogger(__name__)
@@ -11,6 +11,10 @@ T = TypeVar("T")
 # Global injector instance
 _injector: Optional[Injector] = None
 
+# Resolved dependencies. Every binding is a singleton, so after the first
+# resolution a dict lookup replaces the injector's scope machinery.
+_resolved: Dict[Any, Any] = {}
+
 
 def get_injector() -> Injector:
     """Get the global injector instance."""
@@ -24,16 +28,22 @@ def setup_injector(module: Module) -> None:
     """Setup the global injector with a module."""
     global _injector
     _injector = Injector([module])
+    _resolved.clear()
     logger.info("Dependency injection setup completed")
 
 
 def get_dependency(interface: Type[T]) -> T:
     """Get a dependency from the global injector."""
-    return get_injector().get(interface)
+    try:
+        return _resolved[interface]
+    except KeyError:
+        instance = _resolved[interface] = get_injector().get(interface)
+        return instance
 
 
 def clear_injector() -> None:
     """Clear the global injector."""
     global _injector
     _injector = None
+    _resolved.clear()
     logger.info("Dependency injection cleared")
\ No newline at end of file
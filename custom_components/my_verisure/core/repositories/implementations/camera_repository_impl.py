@@ -1,7 +1,7 @@
 """Camera repository implementation."""
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from ...api.camera_client import CameraClient
 from ...api.models.domain.camera_request_image import CameraRequestImageResult
@@ -24,8 +24,9 @@ class CameraRepositoryImpl(CameraRepository):
         panel: str,
         devices: List[int],
         capabilities: str,
+        poll_schedule: Optional[List[float]] = None,
     ) -> CameraRequestImageResult:
-        """Request images from cameras."""
+        """Request images from cameras, optionally with custom status poll waits."""
         try:
             # Call the camera client
             result = await self.client.request_image(
@@ -33,6 +34,7 @@ class CameraRepositoryImpl(CameraRepository):
                 panel=panel,
                 devices=devices,
                 capabilities=capabilities,
+                poll_schedule=poll_schedule,
             )
 
             # Convert DTO to domain model
@@ -73,8 +75,9 @@ class CameraRepositoryImpl(CameraRepository):
         except Exception as e:
             _LOGGER.error("💥 Failed to get camera images: %s", e)
             # Return error result
+            error = str(e)
             return {
                 "success": False,
-                "error": str(e),
-                "message": f"Camera images retrieval failed: {str(e)}",
+                "error": error,
+                "message": f"Camera images retrieval failed: {error}",
             }
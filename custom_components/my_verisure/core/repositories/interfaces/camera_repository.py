@@ -16,8 +16,9 @@ class CameraRepository(ABC):
         panel: str,
         devices: List[int],
         capabilities: str,
+        poll_schedule: Optional[List[float]] = None,
     ) -> CameraRequestImageResult:
-        """Request images from cameras."""
+        """Request images from cameras, optionally with custom status poll waits."""
         pass
 
     @abstractmethod
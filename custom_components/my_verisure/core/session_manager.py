@@ -118,10 +118,10 @@ class SessionManager:
         token_age = current_time - self.session_timestamp
 
         if token_age > 360:  # 6 minutes
-            logger.warning(f"Token expired (age: {token_age:.1f} seconds)")
+            logger.warning("Token expired (age: %.1f seconds)", token_age)
             return False
 
-        logger.warning(f"Token appears valid (age: {token_age:.1f} seconds)")
+        logger.warning("Token appears valid (age: %.1f seconds)", token_age)
         return True
 
     async def _try_automatic_reauthentication(self) -> bool:
@@ -227,12 +227,12 @@ class SessionManager:
         session_age = current_time - self.session_timestamp
         
         if session_age > 360:  # 6 minutes
-            logger.warning(f"Session expired by time (age: {session_age:.1f} seconds)")
+            logger.warning("Session expired by time (age: %.1f seconds)", session_age)
             return False
         
         # Also check if JWT token has expired
         try:
-            if is_jwt_expired(self.hash_token):
+            if is_jwt_expired(self.hash_token, now=current_time):
                 logger.warning("hash_token (JWT) has expired")
                 return False
         except Exception as e:
@@ -240,7 +240,7 @@ class SessionManager:
             # If we can't check JWT expiration, fall back to time-based check
             pass
         
-        logger.debug(f"Session appears valid (age: {session_age:.1f} seconds)")
+        logger.debug("Session appears valid (age: %.1f seconds)", session_age)
         return True
 
     async def ensure_authenticated(self, interactive: bool = True) -> bool:
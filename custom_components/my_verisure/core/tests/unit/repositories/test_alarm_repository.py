@@ -4,8 +4,10 @@ Unit tests for AlarmRepository implementation.
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import MagicMock
 
+from ....api.alarm_client import AlarmClient
+from ....api.models.domain.alarm import ArmResult
 from ....repositories.implementations.alarm_repository_impl import (
     AlarmRepositoryImpl,
 )
@@ -19,13 +21,9 @@ class TestAlarmRepository:
     @pytest.fixture
     def mock_client(self):
         """Create a mock MyVerisureClient."""
-        mock_client = Mock()
-        mock_client.get_alarm_status = AsyncMock()
-        mock_client.arm_alarm_away = AsyncMock()
-        mock_client.arm_alarm_home = AsyncMock()
-        mock_client.arm_alarm_night = AsyncMock()
-        mock_client.disarm_alarm = AsyncMock()
-        return mock_client
+        # spec_set fixes the attribute set up front and makes the client's
+        # coroutine methods AsyncMock children
+        return MagicMock(spec_set=AlarmClient)
 
     @pytest.fixture
     def alarm_repository(self, mock_client):
@@ -36,7 +34,7 @@ class TestAlarmRepository:
         """Test that AlarmRepositoryImpl implements AlarmRepository interface."""
         assert isinstance(alarm_repository, AlarmRepository)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_alarm_status_success(
         self, alarm_repository, mock_client
     ):
@@ -62,12 +60,14 @@ class TestAlarmRepository:
         )
 
         # Assert
-        assert result is not None
+        assert result.status == "ALARM"
+        assert result.message == "Internal day alarm active"
+        assert result.numinst == installation_id
         mock_client.get_alarm_status.assert_called_once_with(
-            installation_id, capabilities
+            installation_id, panel, capabilities
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_alarm_status_raises_exception(
         self, alarm_repository, mock_client
     ):
@@ -86,124 +86,184 @@ class TestAlarmRepository:
                 installation_id, panel, capabilities
             )
 
-    @pytest.mark.asyncio
-    async def test_arm_alarm_away_success(self, alarm_repository, mock_client):
-        """Test successful arm alarm away."""
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_arm_away_success(self, alarm_repository, mock_client):
+        """Test successful arm away."""
         # Arrange
         installation_id = "12345"
-        mock_client.arm_alarm_away.return_value = True
+        panel = "panel1"
+        capabilities = "test_capabilities"
+        mock_client.arm_alarm_away.return_value = ArmResult(
+            success=True, message="Arm away accepted"
+        )
 
         # Act
-        result = await alarm_repository.arm_alarm_away(installation_id)
+        result = await alarm_repository.arm_away(
+            installation_id, panel, capabilities
+        )
 
         # Assert
-        assert result is True
-        mock_client.arm_alarm_away.assert_called_once_with(installation_id)
+        assert result.success is True
+        mock_client.arm_alarm_away.assert_called_once_with(
+            installation_id, panel, capabilities
+        )
 
-    @pytest.mark.asyncio
-    async def test_arm_alarm_away_failure(self, alarm_repository, mock_client):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_arm_away_failure(self, alarm_repository, mock_client):
         """Test failed arm alarm away."""
         # Arrange
         installation_id = "12345"
-        mock_client.arm_alarm_away.return_value = False
+        panel = "panel1"
+        capabilities = "test_capabilities"
+        mock_client.arm_alarm_away.return_value = ArmResult(
+            success=False, message="Arm away rejected"
+        )
 
         # Act
-        result = await alarm_repository.arm_alarm_away(installation_id)
+        result = await alarm_repository.arm_away(
+            installation_id, panel, capabilities
+        )
 
         # Assert
-        assert result is False
-        mock_client.arm_alarm_away.assert_called_once_with(installation_id)
+        assert result.success is False
+        mock_client.arm_alarm_away.assert_called_once_with(
+            installation_id, panel, capabilities
+        )
 
-    @pytest.mark.asyncio
-    async def test_arm_alarm_home_success(self, alarm_repository, mock_client):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_arm_home_success(self, alarm_repository, mock_client):
         """Test successful arm alarm home."""
         # Arrange
         installation_id = "12345"
-        mock_client.arm_alarm_home.return_value = True
+        panel = "panel1"
+        capabilities = "test_capabilities"
+        mock_client.arm_alarm_home.return_value = ArmResult(
+            success=True, message="Arm home accepted"
+        )
 
         # Act
-        result = await alarm_repository.arm_alarm_home(installation_id)
+        result = await alarm_repository.arm_home(
+            installation_id, panel, capabilities
+        )
 
         # Assert
-        assert result is True
-        mock_client.arm_alarm_home.assert_called_once_with(installation_id)
+        assert result.success is True
+        mock_client.arm_alarm_home.assert_called_once_with(
+            installation_id, panel, capabilities
+        )
 
-    @pytest.mark.asyncio
-    async def test_arm_alarm_home_failure(self, alarm_repository, mock_client):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_arm_home_failure(self, alarm_repository, mock_client):
         """Test failed arm alarm home."""
         # Arrange
         installation_id = "12345"
-        mock_client.arm_alarm_home.return_value = False
+        panel = "panel1"
+        capabilities = "test_capabilities"
+        mock_client.arm_alarm_home.return_value = ArmResult(
+            success=False, message="Arm home rejected"
+        )
 
         # Act
-        result = await alarm_repository.arm_alarm_home(installation_id)
+        result = await alarm_repository.arm_home(
+            installation_id, panel, capabilities
+        )
 
         # Assert
-        assert result is False
-        mock_client.arm_alarm_home.assert_called_once_with(installation_id)
+        assert result.success is False
+        mock_client.arm_alarm_home.assert_called_once_with(
+            installation_id, panel, capabilities
+        )
 
-    @pytest.mark.asyncio
-    async def test_arm_alarm_night_success(
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_arm_night_success(
         self, alarm_repository, mock_client
     ):
         """Test successful arm alarm night."""
         # Arrange
         installation_id = "12345"
-        mock_client.arm_alarm_night.return_value = True
+        panel = "panel1"
+        capabilities = "test_capabilities"
+        mock_client.arm_alarm_night.return_value = ArmResult(
+            success=True, message="Arm night accepted"
+        )
 
         # Act
-        result = await alarm_repository.arm_alarm_night(installation_id)
+        result = await alarm_repository.arm_night(
+            installation_id, panel, capabilities
+        )
 
         # Assert
-        assert result is True
-        mock_client.arm_alarm_night.assert_called_once_with(installation_id)
+        assert result.success is True
+        mock_client.arm_alarm_night.assert_called_once_with(
+            installation_id, panel, capabilities
+        )
 
-    @pytest.mark.asyncio
-    async def test_arm_alarm_night_failure(
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_arm_night_failure(
         self, alarm_repository, mock_client
     ):
         """Test failed arm alarm night."""
         # Arrange
         installation_id = "12345"
-        mock_client.arm_alarm_night.return_value = False
+        panel = "panel1"
+        capabilities = "test_capabilities"
+        mock_client.arm_alarm_night.return_value = ArmResult(
+            success=False, message="Arm night rejected"
+        )
 
         # Act
-        result = await alarm_repository.arm_alarm_night(installation_id)
+        result = await alarm_repository.arm_night(
+            installation_id, panel, capabilities
+        )
 
         # Assert
-        assert result is False
-        mock_client.arm_alarm_night.assert_called_once_with(installation_id)
+        assert result.success is False
+        mock_client.arm_alarm_night.assert_called_once_with(
+            installation_id, panel, capabilities
+        )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_disarm_alarm_success(self, alarm_repository, mock_client):
         """Test successful disarm alarm."""
         # Arrange
         installation_id = "12345"
+        panel = "panel1"
+        capabilities = "test_capabilities"
         mock_client.disarm_alarm.return_value = True
 
         # Act
-        result = await alarm_repository.disarm_alarm(installation_id)
+        result = await alarm_repository.disarm_alarm(
+            installation_id, panel, capabilities
+        )
 
         # Assert
         assert result is True
-        mock_client.disarm_alarm.assert_called_once_with(installation_id)
+        mock_client.disarm_alarm.assert_called_once_with(
+            installation_id, panel, capabilities
+        )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_disarm_alarm_failure(self, alarm_repository, mock_client):
         """Test failed disarm alarm."""
         # Arrange
         installation_id = "12345"
+        panel = "panel1"
+        capabilities = "test_capabilities"
         mock_client.disarm_alarm.return_value = False
 
         # Act
-        result = await alarm_repository.disarm_alarm(installation_id)
+        result = await alarm_repository.disarm_alarm(
+            installation_id, panel, capabilities
+        )
 
         # Assert
         assert result is False
-        mock_client.disarm_alarm.assert_called_once_with(installation_id)
+        mock_client.disarm_alarm.assert_called_once_with(
+            installation_id, panel, capabilities
+        )
 
-    @pytest.mark.asyncio
-    async def test_arm_alarm_away_raises_exception(
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_arm_away_raises_exception(
         self, alarm_repository, mock_client
     ):
         """Test arm alarm away raises exception."""
@@ -215,10 +275,12 @@ class TestAlarmRepository:
 
         # Act & Assert
         with pytest.raises(MyVerisureError, match="Connection failed"):
-            await alarm_repository.arm_alarm_away(installation_id)
+            await alarm_repository.arm_away(
+                installation_id, "panel1", "test_capabilities"
+            )
 
-    @pytest.mark.asyncio
-    async def test_arm_alarm_home_raises_exception(
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_arm_home_raises_exception(
         self, alarm_repository, mock_client
     ):
         """Test arm alarm home raises exception."""
@@ -230,10 +292,12 @@ class TestAlarmRepository:
 
         # Act & Assert
         with pytest.raises(MyVerisureError, match="Connection failed"):
-            await alarm_repository.arm_alarm_home(installation_id)
+            await alarm_repository.arm_home(
+                installation_id, "panel1", "test_capabilities"
+            )
 
-    @pytest.mark.asyncio
-    async def test_arm_alarm_night_raises_exception(
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_arm_night_raises_exception(
         self, alarm_repository, mock_client
     ):
         """Test arm alarm night raises exception."""
@@ -245,9 +309,11 @@ class TestAlarmRepository:
 
         # Act & Assert
         with pytest.raises(MyVerisureError, match="Connection failed"):
-            await alarm_repository.arm_alarm_night(installation_id)
+            await alarm_repository.arm_night(
+                installation_id, "panel1", "test_capabilities"
+            )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_disarm_alarm_raises_exception(
         self, alarm_repository, mock_client
     ):
@@ -260,7 +326,9 @@ class TestAlarmRepository:
 
         # Act & Assert
         with pytest.raises(MyVerisureError, match="Connection failed"):
-            await alarm_repository.disarm_alarm(installation_id)
+            await alarm_repository.disarm_alarm(
+                installation_id, "panel1", "test_capabilities"
+            )
 
 
 if __name__ == "__main__":
@@ -4,56 +4,59 @@ Unit tests for AuthRepository implementation.
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock
 
+from ....api.auth_client import AuthClient
 from ....repositories.implementations.auth_repository_impl import (
     AuthRepositoryImpl,
 )
 from ....repositories.interfaces.auth_repository import AuthRepository
 from ....api.models.domain.auth import Auth
-from ....api.models.domain.session import DeviceIdentifiers
 from ....api.exceptions import MyVerisureAuthenticationError, MyVerisureOTPError
 
 
+@pytest.fixture(scope="module")
+def client_template():
+    """Create one AuthClient mock shared by every test in the module.
+
+    The spec makes async client methods AsyncMock children up front.
+    """
+    return Mock(spec=AuthClient)
+
+
+@pytest.fixture(scope="module")
+def auth_repository(client_template):
+    """Create one AuthRepository over the shared client mock.
+
+    The repository holds no state of its own; tests reset the client mock
+    through the mock_client fixture.
+    """
+    return AuthRepositoryImpl(client=client_template)
+
+
 class TestAuthRepository:
     """Test cases for AuthRepository implementation."""
 
     @pytest.fixture
-    def mock_client(self):
-        """Create a mock MyVerisureClient."""
-        mock_client = Mock()
-        mock_client.login = AsyncMock()
-        mock_client.send_otp = AsyncMock()
-        mock_client.verify_otp = AsyncMock()
-        mock_client.get_available_phones = Mock()
-        return mock_client
-
-    @pytest.fixture
-    def auth_repository(self, mock_client):
-        """Create AuthRepository instance with mocked client."""
-        return AuthRepositoryImpl(client=mock_client)
+    def mock_client(self, client_template):
+        """Return the shared AuthClient mock, reset for this test."""
+        client_template.reset_mock(return_value=True, side_effect=True)
+        client_template._hash = None
+        client_template._refresh_token = None
+        client_template._session_data = {}
+        return client_template
 
     def test_auth_repository_implements_interface(self, auth_repository):
         """Test that AuthRepositoryImpl implements AuthRepository interface."""
         assert isinstance(auth_repository, AuthRepository)
 
-    @pytest.mark.asyncio
-    async def test_login_success(self, auth_repository, mock_client):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_login_success(
+        self, auth_repository, mock_client
+    ):
         """Test successful login."""
         # Arrange
         auth = Auth(username="test_user", password="test_password")
-        device_identifiers = DeviceIdentifiers(
-            id_device="device_123",
-            uuid="uuid_456",
-            id_device_indigitall="indigitall_789",
-            device_name="HomeAssistant",
-            device_brand="HomeAssistant",
-            device_os_version="Linux 5.0",
-            device_version="10.154.0",
-            device_type="",
-            device_resolution="",
-            generated_time=0,
-        )
 
         mock_client.login.return_value = True
         # Mock the client's internal state after successful login
@@ -61,71 +64,49 @@ class TestAuthRepository:
         mock_client._session_data = {"user": "test_user", "lang": "es"}
 
         # Act
-        result = await auth_repository.login(auth, device_identifiers)
+        result = await auth_repository.login(auth)
 
         # Assert
         assert result.success is True
         assert result.hash == "test_hash"
         assert result.message == "Login successful"
-        mock_client.login.assert_called_once()
+        assert result.lang == "es"
+        mock_client.login.assert_called_once_with("test_user", "test_password")
 
-    @pytest.mark.asyncio
-    async def test_login_failure(self, auth_repository, mock_client):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_login_failure(
+        self, auth_repository, mock_client
+    ):
         """Test failed login."""
         # Arrange
         auth = Auth(username="test_user", password="wrong_password")
-        device_identifiers = DeviceIdentifiers(
-            id_device="device_123",
-            uuid="uuid_456",
-            id_device_indigitall="indigitall_789",
-            device_name="HomeAssistant",
-            device_brand="HomeAssistant",
-            device_os_version="Linux 5.0",
-            device_version="10.154.0",
-            device_type="",
-            device_resolution="",
-            generated_time=0,
-        )
         mock_client.login.side_effect = MyVerisureAuthenticationError(
             "Invalid credentials"
         )
 
         # Act
-        result = await auth_repository.login(auth, device_identifiers)
+        result = await auth_repository.login(auth)
 
         # Assert
         assert result.success is False
         assert result.hash is None
-        assert "Invalid credentials" in result.message
-        mock_client.login.assert_called_once()
+        assert result.message == "Authentication failed: Invalid credentials"
+        mock_client.login.assert_called_once_with("test_user", "wrong_password")
 
-    @pytest.mark.asyncio
-    async def test_login_otp_required(self, auth_repository, mock_client):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_login_otp_required(
+        self, auth_repository, mock_client
+    ):
         """Test login requires OTP."""
         # Arrange
         auth = Auth(username="test_user", password="test_password")
-        device_identifiers = DeviceIdentifiers(
-            id_device="device_123",
-            uuid="uuid_456",
-            id_device_indigitall="indigitall_789",
-            device_name="HomeAssistant",
-            device_brand="HomeAssistant",
-            device_os_version="Linux 5.0",
-            device_version="10.154.0",
-            device_type="",
-            device_resolution="",
-            generated_time=0,
-        )
         mock_client.login.side_effect = MyVerisureOTPError("OTP required")
 
-        # Act
-        result = await auth_repository.login(auth, device_identifiers)
-
-        # Assert
-        assert result.success is False
-        assert result.hash is None
-        assert "OTP required" in result.message
-        mock_client.login.assert_called_once()
+        # Act & Assert
+        # The OTP challenge is left for the use case to handle
+        with pytest.raises(MyVerisureOTPError, match="OTP required"):
+            await auth_repository.login(auth)
+        mock_client.login.assert_called_once_with("test_user", "test_password")
 
     def test_get_available_phones_success(self, auth_repository, mock_client):
         """Test getting available phones."""
@@ -155,7 +136,7 @@ class TestAuthRepository:
         assert phones == []
         mock_client.get_available_phones.assert_called_once()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_send_otp_success(self, auth_repository, mock_client):
         """Test successful OTP send."""
         # Arrange
@@ -170,7 +151,7 @@ class TestAuthRepository:
         assert result is True
         mock_client.send_otp.assert_called_once_with(record_id, otp_hash)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_send_otp_failure(self, auth_repository, mock_client):
         """Test failed OTP send."""
         # Arrange
@@ -185,7 +166,7 @@ class TestAuthRepository:
         assert result is False
         mock_client.send_otp.assert_called_once_with(record_id, otp_hash)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_send_otp_raises_exception(
         self, auth_repository, mock_client
     ):
@@ -201,24 +182,13 @@ class TestAuthRepository:
         with pytest.raises(MyVerisureOTPError, match="Failed to send OTP"):
             await auth_repository.send_otp(record_id, otp_hash)
 
-    @pytest.mark.asyncio
-    async def test_verify_otp_success(self, auth_repository, mock_client):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_verify_otp_success(
+        self, auth_repository, mock_client
+    ):
         """Test successful OTP verification."""
         # Arrange
         otp_code = "123456"
-        otp_hash = "test_hash"
-        device_identifiers = DeviceIdentifiers(
-            id_device="device_123",
-            uuid="uuid_456",
-            id_device_indigitall="indigitall_789",
-            device_name="HomeAssistant",
-            device_brand="HomeAssistant",
-            device_os_version="Linux 5.0",
-            device_version="10.154.0",
-            device_type="",
-            device_resolution="",
-            generated_time=0,
-        )
         mock_client.verify_otp.return_value = True
         mock_client._hash = "test_hash"
         mock_client._refresh_token = "refresh_token"
@@ -230,75 +200,43 @@ class TestAuthRepository:
         }
 
         # Act
-        result = await auth_repository.verify_otp(
-            otp_code, otp_hash, device_identifiers
-        )
+        result = await auth_repository.verify_otp(otp_code)
 
         # Assert
         assert result.success is True
         assert result.message == "OTP verification successful"
         assert result.hash == "test_hash"
-        # The client's verify_otp method only takes otp_code, not the other parameters
         mock_client.verify_otp.assert_called_once_with(otp_code)
 
-    @pytest.mark.asyncio
-    async def test_verify_otp_failure(self, auth_repository, mock_client):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_verify_otp_failure(
+        self, auth_repository, mock_client
+    ):
         """Test failed OTP verification."""
         # Arrange
         otp_code = "123456"
-        otp_hash = "test_hash"
-        device_identifiers = DeviceIdentifiers(
-            id_device="device_123",
-            uuid="uuid_456",
-            id_device_indigitall="indigitall_789",
-            device_name="HomeAssistant",
-            device_brand="HomeAssistant",
-            device_os_version="Linux 5.0",
-            device_version="10.154.0",
-            device_type="",
-            device_resolution="",
-            generated_time=0,
-        )
         mock_client.verify_otp.return_value = False
 
         # Act
-        result = await auth_repository.verify_otp(
-            otp_code, otp_hash, device_identifiers
-        )
+        result = await auth_repository.verify_otp(otp_code)
 
         # Assert
         assert result.success is False
         assert result.message == "OTP verification failed"
-        # The client's verify_otp method only takes otp_code, not the other parameters
         mock_client.verify_otp.assert_called_once_with(otp_code)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_verify_otp_raises_exception(
         self, auth_repository, mock_client
     ):
         """Test OTP verification raises exception."""
         # Arrange
         otp_code = "123456"
-        otp_hash = "test_hash"
-        device_identifiers = DeviceIdentifiers(
-            id_device="device_123",
-            uuid="uuid_456",
-            id_device_indigitall="indigitall_789",
-            device_name="HomeAssistant",
-            device_brand="HomeAssistant",
-            device_os_version="Linux 5.0",
-            device_version="10.154.0",
-            device_type="",
-            device_resolution="",
-            generated_time=0,
-        )
         mock_client.verify_otp.side_effect = MyVerisureOTPError("Invalid OTP")
 
         # Act & Assert
         with pytest.raises(MyVerisureOTPError, match="Invalid OTP"):
-            await auth_repository.verify_otp(
-                otp_code, otp_hash, device_identifiers
-            )
+            await auth_repository.verify_otp(otp_code)
 
 
 if __name__ == "__main__":
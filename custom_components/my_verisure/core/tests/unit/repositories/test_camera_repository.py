@@ -4,8 +4,9 @@ Unit tests for CameraRepository implementation.
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
+from ....api.camera_client import CameraClient
 from ....repositories.implementations.camera_repository_impl import (
     CameraRepositoryImpl,
 )
@@ -20,10 +21,9 @@ class TestCameraRepository:
     @pytest.fixture
     def mock_client(self):
         """Create a mock CameraClient."""
-        mock_client = Mock()
-        mock_client.request_image = AsyncMock()
-        mock_client.get_images = AsyncMock()
-        return mock_client
+        # spec_set fixes the attribute set up front and makes the client's
+        # coroutine methods AsyncMock children
+        return MagicMock(spec_set=CameraClient)
 
     @pytest.fixture
     def camera_repository(self, mock_client):
@@ -34,7 +34,7 @@ class TestCameraRepository:
         """Test that CameraRepositoryImpl implements CameraRepository interface."""
         assert isinstance(camera_repository, CameraRepository)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_request_image_success(self, camera_repository, mock_client):
         """Test successful camera image request."""
         # Arrange
@@ -58,7 +58,7 @@ class TestCameraRepository:
             reference_id="ref_123"
         )
         
-        with patch('core.api.models.domain.camera_request_image.CameraRequestImageResult.from_dto') as mock_from_dto:
+        with patch.object(CameraRequestImageResult, "from_dto") as mock_from_dto:
             mock_from_dto.return_value = expected_result
             
             # Act
@@ -73,10 +73,11 @@ class TestCameraRepository:
                 panel=panel,
                 devices=devices,
                 capabilities=capabilities,
+                poll_schedule=None,
             )
             mock_from_dto.assert_called_once_with(mock_dto)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_request_image_failure(self, camera_repository, mock_client):
         """Test failed camera image request."""
         # Arrange
@@ -101,9 +102,10 @@ class TestCameraRepository:
             panel=panel,
             devices=devices,
             capabilities=capabilities,
+            poll_schedule=None,
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_request_image_raises_exception(self, camera_repository, mock_client):
         """Test camera image request raises exception."""
         # Arrange
@@ -124,7 +126,7 @@ class TestCameraRepository:
         assert result.successful_requests == 0
         assert result.reference_id is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_images_success(self, camera_repository, mock_client):
         """Test successful get camera images."""
         # Arrange
@@ -160,7 +162,7 @@ class TestCameraRepository:
             capabilities=capabilities,
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_images_failure(self, camera_repository, mock_client):
         """Test failed get camera images."""
         # Arrange
@@ -190,7 +192,7 @@ class TestCameraRepository:
             capabilities=capabilities,
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_images_raises_exception(self, camera_repository, mock_client):
         """Test get camera images raises exception."""
         # Arrange
@@ -213,7 +215,7 @@ class TestCameraRepository:
         assert "API error" in result["error"]
         assert "Camera images retrieval failed" in result["message"]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_request_image_with_empty_devices(self, camera_repository, mock_client):
         """Test camera image request with empty devices list."""
         # Arrange
@@ -235,7 +237,7 @@ class TestCameraRepository:
             reference_id="ref_empty"
         )
         
-        with patch('core.api.models.domain.camera_request_image.CameraRequestImageResult.from_dto') as mock_from_dto:
+        with patch.object(CameraRequestImageResult, "from_dto") as mock_from_dto:
             mock_from_dto.return_value = expected_result
             
             # Act
@@ -250,9 +252,10 @@ class TestCameraRepository:
                 panel=panel,
                 devices=devices,
                 capabilities=capabilities,
+                poll_schedule=None,
             )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_images_with_special_characters(self, camera_repository, mock_client):
         """Test get camera images with special characters in parameters."""
         # Arrange
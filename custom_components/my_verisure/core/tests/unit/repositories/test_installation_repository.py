@@ -4,153 +4,79 @@ Unit tests for InstallationRepository implementation.
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, call, create_autospec, patch
 
+from ....file_manager import FileManager
 from ....repositories.implementations.installation_repository_impl import InstallationRepositoryImpl
 from ....repositories.interfaces.installation_repository import InstallationRepository
 from ....api.exceptions import MyVerisureError
 from ....api.models.dto.installation_dto import (
     InstallationDTO,
+    InstallationDataDTO,
     DetailedInstallationDTO,
     ServiceDTO,
 )
 
 
-class TestInstallationRepository:
-    """Test cases for InstallationRepository implementation."""
-
-    @pytest.fixture
-    def mock_client(self):
-        """Create a mock MyVerisureClient."""
-        mock_client = Mock()
-        mock_client.get_installations = AsyncMock()
-        mock_client.get_installation_services = AsyncMock()
-        # Mock the hash token
-        mock_client._hash = "test_hash_token_12345"
-        return mock_client
-
-    @pytest.fixture
-    def installation_repository(self, mock_client):
-        """Create InstallationRepository instance with mocked client."""
-        repo = InstallationRepositoryImpl(client=mock_client)
-        # Clear cache before each test
-        repo._clear_cache()
-        return repo
-
-    def test_installation_repository_implements_interface(
-        self, installation_repository
-    ):
-        """Test that InstallationRepositoryImpl implements InstallationRepository interface."""
-        assert isinstance(installation_repository, InstallationRepository)
-
-    @pytest.mark.asyncio
-    async def test_get_installations_success(
-        self, installation_repository, mock_client
-    ):
-        """Test successful get installations."""
-        # Arrange
-        expected_installations_data = [
-            InstallationDTO(
-                numinst="12345",
-                alias="Home",
-                panel="panel1",
-                type="residential",
-                name="John",
-                surname="Doe",
-                address="123 Main St",
-                city="Madrid",
-                postcode="28001",
-                province="Madrid",
-                email="john@example.com",
-                phone="+34600000000",
-                due="2024-12-31",
-                role="owner",
-            ),
-            InstallationDTO(
-                numinst="67890",
-                alias="Office",
-                panel="panel2",
-                type="commercial",
-                name="Jane",
-                surname="Smith",
-                address="456 Business Ave",
-                city="Barcelona",
-                postcode="08001",
-                province="Barcelona",
-                email="jane@example.com",
-                phone="+34600000001",
-                due="2024-12-31",
-                role="user",
-            ),
-        ]
-
-        mock_client.get_installations.return_value = (
-            expected_installations_data
-        )
-
-        # Act
-        result = await installation_repository.get_installations()
-
-        # Assert
-        assert len(result) == 2
-        assert result[0].numinst == "12345"
-        assert result[0].alias == "Home"
-        assert result[0].type == "residential"
-        assert result[1].numinst == "67890"
-        assert result[1].alias == "Office"
-        assert result[1].type == "commercial"
-        mock_client.get_installations.assert_called_once_with(
-            hash_token="test_hash_token_12345", session_data=mock_client._session_data
-        )
-
-    @pytest.mark.asyncio
-    async def test_get_installations_empty(
-        self, installation_repository, mock_client
-    ):
-        """Test get installations returns empty list."""
-        # Arrange
-        mock_client.get_installations.return_value = []
-
-        # Act
-        result = await installation_repository.get_installations()
-
-        # Assert
-        assert result == []
-        mock_client.get_installations.assert_called_once_with(
-            hash_token="test_hash_token_12345", session_data=mock_client._session_data
-        )
-
-    @pytest.mark.asyncio
-    async def test_get_installations_raises_exception(
-        self, installation_repository, mock_client
-    ):
-        """Test get installations raises exception."""
-        # Arrange
-        mock_client.get_installations.side_effect = MyVerisureError(
-            "Connection failed"
-        )
+# Client coroutines the repository awaits, pre-created on every mock client
+_CLIENT_ASYNC_METHODS = (
+    "get_installations",
+    "get_installation_services",
+)
 
-        # Act & Assert
-        with pytest.raises(MyVerisureError, match="Connection failed"):
-            await installation_repository.get_installations()
 
-    @pytest.mark.asyncio
-    async def test_get_installation_services_success(
-        self, installation_repository, mock_client
-    ):
-        """Test successful get installation services."""
-        # Arrange
-        installation_id = "12345"
-        expected_services_data = DetailedInstallationDTO(
-            installation={
-                "numinst": "12345",
-                "role": "owner",
-                "alias": "Home",
-                "status": "active",
-                "panel": "panel1",
-                "sim": "sim1",
-                "instIbs": "ibs1",
-            },
+# Payloads are session-scoped: they are built once and shared by every test
+@pytest.fixture(scope="session")
+def installations_payload():
+    """Installations returned by the mocked client."""
+    return (
+        InstallationDTO(
+            numinst="12345",
+            alias="Home",
+            panel="panel1",
+            type="residential",
+            name="John",
+            surname="Doe",
+            address="123 Main St",
+            city="Madrid",
+            postcode="28001",
+            province="Madrid",
+            email="john@example.com",
+            phone="+34600000000",
+            due="2024-12-31",
+            role="owner",
+        ),
+        InstallationDTO(
+            numinst="67890",
+            alias="Office",
+            panel="panel2",
+            type="commercial",
+            name="Jane",
+            surname="Smith",
+            address="456 Business Ave",
+            city="Barcelona",
+            postcode="08001",
+            province="Barcelona",
+            email="jane@example.com",
+            phone="+34600000001",
+            due="2024-12-31",
+            role="user",
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def services_payload():
+    """Installation services returned by the mocked client."""
+    return DetailedInstallationDTO(
+        installation=InstallationDataDTO(
+            numinst="12345",
+            role="owner",
+            alias="Home",
+            status="active",
+            panel="panel1",
+            sim="sim1",
+            instIbs="ibs1",
             services=[
                 ServiceDTO(
                     id_service="EST",
@@ -183,12 +109,101 @@ class TestInstallationRepository:
                     attributes=[],
                 ),
             ],
-            language="es",
-        )
+            devices=[],
+        ),
+        language="es",
+    )
 
-        mock_client.get_installation_services.return_value = (
-            expected_services_data
+
+class TestInstallationRepository:
+    """Test cases for InstallationRepository implementation."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock MyVerisureClient."""
+        mock_client = Mock()
+        for name in _CLIENT_ASYNC_METHODS:
+            setattr(mock_client, name, AsyncMock())
+        # Mock the hash token
+        mock_client._hash = "test_hash_token_12345"
+        return mock_client
+
+    @pytest.fixture
+    def mock_file_manager(self):
+        """Create a file manager mock with an empty installation cache."""
+        mock_file_manager = create_autospec(FileManager, instance=True)
+        mock_file_manager.load_json.return_value = None
+        mock_file_manager.save_json.return_value = True
+        return mock_file_manager
+
+    @pytest.fixture
+    def installation_repository(self, mock_client, mock_file_manager):
+        """Create InstallationRepository instance with mocked client and no disk cache."""
+        with patch(
+            f"{InstallationRepositoryImpl.__module__}.get_file_manager",
+            return_value=mock_file_manager,
+        ):
+            return InstallationRepositoryImpl(client=mock_client)
+
+    def test_installation_repository_implements_interface(
+        self, installation_repository
+    ):
+        """Test that InstallationRepositoryImpl implements InstallationRepository interface."""
+        assert isinstance(installation_repository, InstallationRepository)
+
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(
+        "use_payload, side_effect, expected",
+        [
+            (
+                True,
+                None,
+                [("12345", "Home", "residential"), ("67890", "Office", "commercial")],
+            ),
+            (False, None, []),
+            (False, MyVerisureError("Connection failed"), None),
+        ],
+        ids=["success", "empty", "raises_exception"],
+    )
+    async def test_get_installations(
+        self,
+        installation_repository,
+        mock_client,
+        installations_payload,
+        use_payload,
+        side_effect,
+        expected,
+    ):
+        """Test get installations with data, without data and on error."""
+        # Arrange
+        mock_client.get_installations.return_value = (
+            list(installations_payload) if use_payload else []
         )
+        mock_client.get_installations.side_effect = side_effect
+
+        # Act & Assert
+        if side_effect is not None:
+            with pytest.raises(MyVerisureError, match="Connection failed"):
+                await installation_repository.get_installations()
+            return
+
+        result = await installation_repository.get_installations()
+
+        assert [
+            (installation.numinst, installation.alias, installation.type)
+            for installation in result
+        ] == expected
+        assert mock_client.get_installations.call_count == 1
+        assert mock_client.get_installations.call_args == call()
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_get_installation_services_success(
+        self, installation_repository, mock_client, services_payload
+    ):
+        """Test successful get installation services."""
+        # Arrange
+        installation_id = "12345"
+        mock_client.get_installation_services.return_value = services_payload
 
         # Act
         result = await installation_repository.get_installation_services(
@@ -204,40 +219,27 @@ class TestInstallationRepository:
         assert result.installation.services[1].active is True
         assert result.installation.status == "active"
         assert result.installation.panel == "panel1"
-        mock_client.get_installation_services.assert_called_once_with(
-            installation_id, False, hash_token="test_hash_token_12345", session_data=mock_client._session_data
-        )
-
-    @pytest.mark.asyncio
-    async def test_get_installation_services_failure(
-        self, installation_repository, mock_client
-    ):
-        """Test failed get installation services."""
-        # Arrange
-        installation_id = "12345"
-        mock_client.get_installation_services.side_effect = MyVerisureError(
-            "Installation not found"
+        assert mock_client.get_installation_services.call_count == 1
+        assert mock_client.get_installation_services.call_args == call(
+            installation_id, False
         )
 
-        # Act & Assert
-        with pytest.raises(MyVerisureError, match="Installation not found"):
-            await installation_repository.get_installation_services(
-                installation_id
-            )
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(
+        "message", ["Installation not found", "Connection failed"]
+    )
     async def test_get_installation_services_raises_exception(
-        self, installation_repository, mock_client
+        self, installation_repository, mock_client, message
     ):
-        """Test get installation services raises exception."""
+        """Test get installation services propagates client errors."""
         # Arrange
         installation_id = "12345"
         mock_client.get_installation_services.side_effect = MyVerisureError(
-            "Connection failed"
+            message
         )
 
         # Act & Assert
-        with pytest.raises(MyVerisureError, match="Connection failed"):
+        with pytest.raises(MyVerisureError, match=message):
             await installation_repository.get_installation_services(
                 installation_id
             )
@@ -3,6 +3,7 @@
 import pytest
 
 from ...api.models.domain.auth import Auth, AuthResult
+from ...api.models.domain.device import Device
 
 
 class TestAuth:
@@ -146,3 +147,17 @@ class TestAuthResult:
         assert result.legals is None
         assert result.change_password is None
         assert result.need_device_authorization is None
+
+
+class TestDevice:
+    """Test Device domain model."""
+
+    def test_device_formatted_code(self):
+        """Test formatted_code zero-pads the numeric code after the type."""
+        device = Device(
+            id="1", code="3", name="Salon", type="YR", subtype="",
+            remote_use=True, id_service="1", is_active=True,
+        )
+
+        assert device.formatted_code == "YR03"
+        assert device.formatted_code is device.formatted_code
@@ -4,7 +4,7 @@ Unit tests for AlarmUseCase implementation.
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock
 
 from ....api.models.domain.installation import DetailedInstallation
 from ....use_cases.implementations.alarm_use_case_impl import AlarmUseCaseImpl
@@ -22,19 +22,12 @@ class TestAlarmUseCase:
     @pytest.fixture
     def mock_alarm_repository(self):
         """Create a mock alarm repository."""
-        mock_repo = Mock(spec=AlarmRepository)
-        mock_repo.get_alarm_status = AsyncMock()
-        mock_repo.arm_alarm_away = AsyncMock()
-        mock_repo.arm_alarm_home = AsyncMock()
-        mock_repo.arm_alarm_night = AsyncMock()
-        mock_repo.disarm_alarm = AsyncMock()
-        return mock_repo
+        return Mock(spec=AlarmRepository)
 
     @pytest.fixture
     def mock_installation_repository(self):
         """Create a mock installation repository."""
         mock_repo = Mock(spec=InstallationRepository)
-        mock_repo.get_installation_services = AsyncMock()
 
         # Default mock response for installation services
         from core.api.models.domain.installation import InstallationData
@@ -4,7 +4,7 @@ Unit tests for AuthUseCase implementation.
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock
 
 from ....use_cases.implementations.auth_use_case_impl import AuthUseCaseImpl
 from ....use_cases.interfaces.auth_use_case import AuthUseCase
@@ -20,12 +20,7 @@ class TestAuthUseCase:
     @pytest.fixture
     def mock_auth_repository(self):
         """Create a mock auth repository."""
-        mock_repo = Mock(spec=AuthRepository)
-        mock_repo.login = AsyncMock()
-        mock_repo.send_otp = AsyncMock()
-        mock_repo.verify_otp = AsyncMock()
-        mock_repo.get_available_phones = Mock()
-        return mock_repo
+        return Mock(spec=AuthRepository)
 
     @pytest.fixture
     def auth_use_case(self, mock_auth_repository):
@@ -138,6 +133,31 @@ class TestAuthUseCase:
         assert phones == expected_phones
         # Note: get_available_phones doesn't call the repository, it uses internal state
 
+    def test_get_available_phones_cached_for_same_otp_data(self, auth_use_case):
+        """Test that cached phones are returned as copies and rebuilt when the OTP data changes."""
+        # Arrange
+        auth_use_case._otp_data = {
+            "phones": [{"id": 1, "phone": "+34600000001", "record_id": 10, "otp_hash": "hash"}]
+        }
+
+        # Act
+        first = auth_use_case.get_available_phones()
+        first[0]["phone"] = "changed"
+        first.append({"id": 99})
+        second = auth_use_case.get_available_phones()
+        auth_use_case._otp_data = {
+            "phones": [{"id": 2, "phone": "+34600000002", "record_id": 20, "otp_hash": "hash"}]
+        }
+        third = auth_use_case.get_available_phones()
+
+        # Assert
+        assert second == [
+            {"id": 1, "phone": "+34600000001", "record_id": 10, "otp_hash": "hash"}
+        ]
+        assert third == [
+            {"id": 2, "phone": "+34600000002", "record_id": 20, "otp_hash": "hash"}
+        ]
+
     @pytest.mark.asyncio
     async def test_send_otp_success(self, auth_use_case, mock_auth_repository):
         """Test successful OTP send."""
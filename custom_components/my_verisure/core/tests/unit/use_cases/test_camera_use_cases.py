@@ -3,11 +3,16 @@
 Unit tests for Camera Use Cases implementations.
 """
 
+import asyncio
+
 import pytest
-from unittest.mock import Mock, AsyncMock
+from dataclasses import dataclass, replace
+from typing import Tuple
+from unittest.mock import create_autospec, patch
 
 from ....use_cases.implementations.refresh_camera_images_use_case_impl import (
     RefreshCameraImagesUseCaseImpl,
+    _poll_schedule_from_samples,
 )
 from ....use_cases.implementations.create_dummy_camera_images_use_case_impl import (
     CreateDummyCameraImagesUseCaseImpl,
@@ -21,25 +26,55 @@ from ....use_cases.interfaces.create_dummy_camera_images_use_case import (
 from ....repositories.interfaces.camera_repository import CameraRepository
 from ....repositories.interfaces.installation_repository import InstallationRepository
 from ....api.models.domain.camera_request_image import CameraRequestImageResult
+from ....api.models.domain.device import Device
 from ....api.exceptions import MyVerisureError
 
 
+@dataclass(frozen=True, slots=True)
+class _Inst:
+    """Minimal stand-in for the installation returned by get_installation_services."""
+
+    panel: str
+    capabilities: str
+    devices: Tuple[Device, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class _Svcs:
+    """Minimal stand-in for the detailed installation services response."""
+
+    installation: _Inst
+
+
+def _camera_device(code: str, device_type: str) -> Device:
+    """Build a remote camera device for the given code and type."""
+    return Device(
+        id=code, code=code, name=f"Camera {code}", type=device_type,
+        subtype="", remote_use=True, id_service="1", is_active=True,
+    )
+
+
+def _services(
+    *devices: Device,
+    panel: str = "PROTOCOL",
+    capabilities: str = "default_capabilities",
+) -> _Svcs:
+    """Build an installation services response holding the given devices."""
+    return _Svcs(_Inst(panel, capabilities, devices))
+
+
 class TestRefreshCameraImagesUseCase:
     """Test cases for RefreshCameraImagesUseCase implementation."""
 
     @pytest.fixture
     def mock_camera_repository(self):
         """Create a mock camera repository."""
-        mock_repo = Mock(spec=CameraRepository)
-        mock_repo.request_image = AsyncMock()
-        return mock_repo
+        return create_autospec(CameraRepository, spec_set=True, instance=True)
 
     @pytest.fixture
     def mock_installation_repository(self):
         """Create a mock installation repository."""
-        mock_repo = Mock(spec=InstallationRepository)
-        mock_repo.get_installation_services = AsyncMock()
-        return mock_repo
+        return create_autospec(InstallationRepository, spec_set=True, instance=True)
 
     @pytest.fixture
     def refresh_use_case(self, mock_camera_repository, mock_installation_repository):
@@ -58,243 +93,493 @@ class TestRefreshCameraImagesUseCase:
         """Test successful camera images refresh."""
         # Arrange
         installation_id = "12345"
-        
-        # Mock installation services
-        mock_services = Mock()
-        mock_installation = Mock()
-        mock_installation.panel = "PROTOCOL"
-        mock_installation.capabilities = "default_capabilities"
-        mock_services.installation = mock_installation
-        mock_installation_repository.get_installation_services.return_value = mock_services
-        
-        # Mock camera repository response
-        expected_result = CameraRequestImageResult(
+        mock_installation_repository.get_installation_services.return_value = _services(
+            _camera_device("1", "YR")
+        )
+        mock_camera_repository.request_image.return_value = CameraRequestImageResult(
             success=True,
-            successful_requests=3,
+            successful_requests=1,
             reference_id="ref_123"
         )
-        mock_camera_repository.request_image.return_value = expected_result
-        
+        mock_camera_repository.get_images.return_value = {"success": True, "images_saved": 3}
+
         # Act
         result = await refresh_use_case.refresh_camera_images(installation_id)
-        
+
         # Assert
-        assert result == expected_result
-        mock_installation_repository.get_installation_services.assert_called_once_with(installation_id)
+        assert result.total_cameras == 1
+        assert result.successful_refreshes == 1
+        assert result.failed_refreshes == 0
+        assert [(d.camera_identifier, d.num_images) for d in result.refresh_data] == [
+            ("YR01", 3),
+        ]
+        mock_installation_repository.get_installation_services.assert_called_once_with(
+            installation_id, force_refresh=False
+        )
         mock_camera_repository.request_image.assert_called_once_with(
             installation_id=installation_id,
             panel="PROTOCOL",
-            devices=[],  # Empty devices list for refresh
-            capabilities="default_capabilities"
+            devices=[1],
+            capabilities="default_capabilities",
+            poll_schedule=None,
         )
 
     @pytest.mark.asyncio
-    async def test_refresh_camera_images_installation_error(self, refresh_use_case, mock_installation_repository):
+    async def test_refresh_camera_images_installation_error(self, refresh_use_case, mock_camera_repository, mock_installation_repository):
         """Test camera images refresh when installation services fail."""
         # Arrange
         installation_id = "12345"
         mock_installation_repository.get_installation_services.side_effect = MyVerisureError("Installation not found")
-        
+
         # Act
         result = await refresh_use_case.refresh_camera_images(installation_id)
-        
+
         # Assert
-        assert result.success is False
-        assert result.successful_requests == 0
-        assert result.reference_id is None
+        assert result.total_cameras == 0
+        assert result.refresh_data == []
+        mock_camera_repository.request_image.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_refresh_camera_images_camera_error(self, refresh_use_case, mock_camera_repository, mock_installation_repository):
         """Test camera images refresh when camera request fails."""
         # Arrange
         installation_id = "12345"
-        
-        # Mock installation services
-        mock_services = Mock()
-        mock_installation = Mock()
-        mock_installation.panel = "PROTOCOL"
-        mock_installation.capabilities = "default_capabilities"
-        mock_services.installation = mock_installation
-        mock_installation_repository.get_installation_services.return_value = mock_services
-        
-        # Mock camera repository failure
+        mock_installation_repository.get_installation_services.return_value = _services(
+            _camera_device("1", "YR"), _camera_device("2", "YP")
+        )
         mock_camera_repository.request_image.return_value = CameraRequestImageResult(
             success=False,
             successful_requests=0,
             reference_id=None
         )
-        
+
         # Act
         result = await refresh_use_case.refresh_camera_images(installation_id)
-        
+
+        # Assert
+        assert result.total_cameras == 2
+        assert result.successful_refreshes == 0
+        assert result.failed_refreshes == 2
+        mock_camera_repository.get_images.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_images_polls_until_images_saved(self, refresh_use_case, mock_camera_repository):
+        """Test that image retrieval is retried with backoff until images are saved."""
+        # Arrange
+        mock_camera_repository.get_images.side_effect = [
+            {"success": True, "images_saved": 0},
+            {"success": True, "images_saved": 0},
+            {"success": True, "images_saved": 0},
+            {"success": True, "images_saved": 0},
+            {"success": True, "images_saved": 3},
+        ]
+
+        # Act
+        with patch(
+            f"{RefreshCameraImagesUseCaseImpl.__module__}.asyncio.sleep"
+        ) as mock_sleep:
+            result = await refresh_use_case._wait_for_images(
+                installation_id="12345",
+                panel="PROTOCOL",
+                device="YR",
+                zone_id="YR01",
+                capabilities="default_capabilities",
+                max_attempts=5,
+                check_interval=2,
+            )
+
         # Assert
-        assert result.success is False
-        assert result.successful_requests == 0
-        assert result.reference_id is None
+        assert result["images_saved"] == 3
+        assert mock_camera_repository.get_images.call_count == 5
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0, 2.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_refresh_camera_images_retrieves_each_camera(self, refresh_use_case, mock_camera_repository, mock_installation_repository):
+        """Test one batched request is followed by a retrieval per camera."""
+        # Arrange
+        mock_installation_repository.get_installation_services.return_value = _services(
+            _camera_device("1", "YR"),
+            _camera_device("2", "YP"),
+            _camera_device("3", "MG"),
+            replace(_camera_device("4", "YR"), remote_use=False),
+        )
+        mock_camera_repository.request_image.return_value = CameraRequestImageResult(
+            success=True, successful_requests=2, reference_id="ref_1"
+        )
+        mock_camera_repository.get_images.side_effect = [
+            {"success": True, "images_saved": 3},
+            MyVerisureError("Camera offline"),
+        ]
+
+        # Act
+        result = await refresh_use_case.refresh_camera_images("12345")
+
+        # Assert
+        assert result.total_cameras == 2
+        assert result.successful_refreshes == 1
+        assert [(d.camera_identifier, d.num_images) for d in result.refresh_data] == [
+            ("YR01", 3),
+            ("YP02", 0),
+        ]
+        mock_camera_repository.request_image.assert_called_once_with(
+            installation_id="12345",
+            panel="PROTOCOL",
+            devices=[1, 2],
+            capabilities="default_capabilities",
+            poll_schedule=None,
+        )
+        assert mock_camera_repository.get_images.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_camera_images_counts_camera_without_images_as_failed(self, refresh_use_case, mock_camera_repository, mock_installation_repository):
+        """Test a camera that never saves images within max_attempts counts as failed."""
+        # Arrange
+        mock_installation_repository.get_installation_services.return_value = _services(
+            _camera_device("1", "YR")
+        )
+        mock_camera_repository.request_image.return_value = CameraRequestImageResult(
+            success=True, successful_requests=1, reference_id="ref_1"
+        )
+        mock_camera_repository.get_images.return_value = {"success": True, "images_saved": 0}
+
+        # Act
+        with patch(f"{RefreshCameraImagesUseCaseImpl.__module__}.asyncio.sleep"):
+            result = await refresh_use_case.refresh_camera_images("12345", max_attempts=2)
+
+        # Assert
+        assert result.successful_refreshes == 0
+        assert result.failed_refreshes == 1
+        assert mock_camera_repository.get_images.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_camera_images_isolates_unexpected_camera_errors(self, refresh_use_case, mock_camera_repository, mock_installation_repository):
+        """Test an unexpected error from one camera is recorded without losing the others."""
+        # Arrange
+        mock_installation_repository.get_installation_services.return_value = _services(
+            _camera_device("1", "YR"), _camera_device("2", "YP")
+        )
+        mock_camera_repository.request_image.return_value = CameraRequestImageResult(
+            success=True, successful_requests=2, reference_id="ref_1"
+        )
+
+        async def get_images(**kwargs):
+            if kwargs["zone_id"] == "YR01":
+                raise KeyError("images_saved")
+            return {"success": True, "images_saved": 3}
+
+        mock_camera_repository.get_images.side_effect = get_images
+
+        # Act
+        result = await refresh_use_case.refresh_camera_images("12345")
+
+        # Assert
+        assert result.total_cameras == 2
+        assert result.successful_refreshes == 1
+        assert [(d.camera_identifier, d.num_images) for d in result.refresh_data] == [
+            ("YR01", 0),
+            ("YP02", 3),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_refresh_camera_images_skips_non_numeric_codes(self, refresh_use_case, mock_camera_repository, mock_installation_repository):
+        """Test a camera with a non-numeric code is skipped instead of failing the refresh."""
+        # Arrange
+        mock_installation_repository.get_installation_services.return_value = _services(
+            _camera_device("X1", "YR"), _camera_device("2", "YP")
+        )
+        mock_camera_repository.request_image.return_value = CameraRequestImageResult(
+            success=True, successful_requests=1, reference_id="ref_1"
+        )
+        mock_camera_repository.get_images.return_value = {"success": True, "images_saved": 2}
+
+        # Act
+        result = await refresh_use_case.refresh_camera_images("12345")
+
+        # Assert
+        assert result.total_cameras == 1
+        assert [(d.camera_identifier, d.num_images) for d in result.refresh_data] == [
+            ("YP02", 2),
+        ]
+        assert mock_camera_repository.request_image.call_args.kwargs["devices"] == [2]
+
+    @pytest.mark.asyncio
+    async def test_refresh_camera_images_caches_installation_metadata(self, refresh_use_case, mock_camera_repository, mock_installation_repository):
+        """Test installation services are fetched once until the cache is invalidated."""
+        # Arrange
+        mock_installation_repository.get_installation_services.return_value = _services(
+            _camera_device("1", "YR")
+        )
+        mock_camera_repository.request_image.return_value = CameraRequestImageResult(
+            success=False, successful_requests=0, reference_id=None
+        )
+
+        # Act
+        await refresh_use_case.refresh_camera_images("12345")
+        await refresh_use_case.refresh_camera_images("12345")
+        refresh_use_case.invalidate("12345")
+        await refresh_use_case.refresh_camera_images("12345")
+
+        # Assert
+        assert [
+            c.kwargs["force_refresh"]
+            for c in mock_installation_repository.get_installation_services.call_args_list
+        ] == [False, True]
+        assert mock_camera_repository.request_image.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_refresh_camera_images_refetches_after_rejected_request(self, refresh_use_case, mock_camera_repository, mock_installation_repository):
+        """Test a rejected image request forces the next refresh to refetch the installation."""
+        # Arrange
+        mock_installation_repository.get_installation_services.return_value = _services(
+            _camera_device("1", "YR")
+        )
+        mock_camera_repository.request_image.side_effect = [
+            MyVerisureError("Invalid capabilities"),
+            CameraRequestImageResult(success=False, successful_requests=0, reference_id=None),
+        ]
+
+        # Act
+        await refresh_use_case.refresh_camera_images("12345")
+        await refresh_use_case.refresh_camera_images("12345")
+
+        # Assert
+        assert [
+            c.kwargs["force_refresh"]
+            for c in mock_installation_repository.get_installation_services.call_args_list
+        ] == [False, True]
+
+    def test_poll_schedule_from_samples_follows_deciles(self):
+        """Test status polls land on the deciles of past request durations."""
+        # Act
+        schedule = _poll_schedule_from_samples([float(s) for s in range(20, 0, -2)])
+
+        # Assert
+        assert schedule[:3] == [1.0, 1.0, 2.0]
+        assert sum(schedule) == 20.0
+        assert all(delay >= 1.0 for delay in schedule)
+
+    @pytest.mark.asyncio
+    async def test_refresh_camera_images_coalesces_concurrent_calls(self, refresh_use_case, mock_camera_repository, mock_installation_repository):
+        """Test overlapping refreshes of one installation share a single run."""
+        # Arrange
+        mock_installation_repository.get_installation_services.return_value = _services(
+            _camera_device("1", "YR")
+        )
+        mock_camera_repository.request_image.return_value = CameraRequestImageResult(
+            success=False, successful_requests=0, reference_id=None
+        )
+
+        # Act
+        first, second = await asyncio.gather(
+            refresh_use_case.refresh_camera_images("12345"),
+            refresh_use_case.refresh_camera_images("12345"),
+        )
+
+        # Assert
+        assert first == second
+        assert first is not second
+        mock_camera_repository.request_image.assert_called_once()
+        assert refresh_use_case._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_refresh_camera_images_does_not_coalesce_different_parameters(self, refresh_use_case, mock_camera_repository, mock_installation_repository):
+        """Test overlapping refreshes with different polling parameters run separately."""
+        # Arrange
+        mock_installation_repository.get_installation_services.return_value = _services(
+            _camera_device("1", "YR")
+        )
+        mock_camera_repository.request_image.return_value = CameraRequestImageResult(
+            success=False, successful_requests=0, reference_id=None
+        )
+
+        # Act
+        await asyncio.gather(
+            refresh_use_case.refresh_camera_images("12345"),
+            refresh_use_case.refresh_camera_images("12345", max_attempts=5),
+        )
+
+        # Assert
+        assert mock_camera_repository.request_image.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_many_refreshes_each_installation(self, refresh_use_case, mock_installation_repository):
+        """Test refresh_many returns one result per installation."""
+        # Arrange
+        mock_installation_repository.get_installation_services.return_value = _services()
+
+        # Act
+        results = await refresh_use_case.refresh_many(["111", "222"], limit=1)
+
+        # Assert
+        assert list(results) == ["111", "222"]
+        assert all(result.total_cameras == 0 for result in results.values())
+        assert mock_installation_repository.get_installation_services.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_camera_setup_fetches_once_for_concurrent_callers(self, refresh_use_case, mock_installation_repository):
+        """Test concurrent cache misses share a single installation services call."""
+        # Arrange
+        async def slow_services(installation_id, force_refresh=False):
+            await asyncio.sleep(0.01)
+            return _services(_camera_device("1", "YR"))
+
+        mock_installation_repository.get_installation_services.side_effect = slow_services
+
+        # Act
+        results = await asyncio.gather(
+            refresh_use_case._get_camera_setup("12345"),
+            refresh_use_case._get_camera_setup("12345"),
+        )
+
+        # Assert
+        assert results[0] == results[1]
+        mock_installation_repository.get_installation_services.assert_called_once_with(
+            "12345", force_refresh=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_refresh_camera_images_request_timeout(self, mock_camera_repository, mock_installation_repository):
+        """Test a hung image request is recorded as a failed camera."""
+        # Arrange
+        refresh_use_case = RefreshCameraImagesUseCaseImpl(
+            camera_repository=mock_camera_repository,
+            installation_repository=mock_installation_repository,
+            request_timeout=0.01,
+        )
+        mock_installation_repository.get_installation_services.return_value = _services(
+            _camera_device("1", "YR")
+        )
+
+        async def hang(**kwargs):
+            await asyncio.sleep(10)
+
+        mock_camera_repository.request_image.side_effect = hang
+
+        # Act
+        result = await refresh_use_case.refresh_camera_images("12345")
+
+        # Assert
+        assert result.total_cameras == 1
+        assert result.failed_refreshes == 1
+        assert result.refresh_data == []
+        mock_camera_repository.get_images.assert_not_called()
 
 
 class TestCreateDummyCameraImagesUseCase:
     """Test cases for CreateDummyCameraImagesUseCase implementation."""
 
-    @pytest.fixture
-    def mock_camera_repository(self):
-        """Create a mock camera repository."""
-        mock_repo = Mock(spec=CameraRepository)
-        mock_repo.get_images = AsyncMock()
-        return mock_repo
-
     @pytest.fixture
     def mock_installation_repository(self):
         """Create a mock installation repository."""
-        mock_repo = Mock(spec=InstallationRepository)
-        mock_repo.get_installation_services = AsyncMock()
-        return mock_repo
+        return create_autospec(InstallationRepository, spec_set=True, instance=True)
 
     @pytest.fixture
-    def create_dummy_use_case(self, mock_camera_repository, mock_installation_repository):
+    def create_dummy_use_case(self, mock_installation_repository):
         """Create CreateDummyCameraImagesUseCase instance with mocked dependencies."""
         return CreateDummyCameraImagesUseCaseImpl(
-            camera_repository=mock_camera_repository,
             installation_repository=mock_installation_repository
         )
 
+    @pytest.fixture
+    def data_directory(self, tmp_path):
+        """Point the file manager's data directory at a temporary path."""
+        with patch(
+            f"{CreateDummyCameraImagesUseCaseImpl.__module__}.get_file_manager"
+        ) as get_file_manager:
+            get_file_manager.return_value.get_data_directory.return_value = str(tmp_path)
+            yield tmp_path
+
     def test_create_dummy_use_case_implements_interface(self, create_dummy_use_case):
         """Test that CreateDummyCameraImagesUseCaseImpl implements CreateDummyCameraImagesUseCase interface."""
         assert isinstance(create_dummy_use_case, CreateDummyCameraImagesUseCase)
 
     @pytest.mark.asyncio
-    async def test_create_dummy_camera_images_success(self, create_dummy_use_case, mock_camera_repository, mock_installation_repository):
-        """Test successful dummy camera images creation."""
+    async def test_create_dummy_camera_images_success(self, create_dummy_use_case, mock_installation_repository, data_directory):
+        """Test dummy images are written for a camera without images."""
         # Arrange
         installation_id = "12345"
-        device = "device1"
-        zone_id = "zone1"
-        
-        # Mock installation services
-        mock_services = Mock()
-        mock_installation = Mock()
-        mock_installation.panel = "PROTOCOL"
-        mock_installation.capabilities = "default_capabilities"
-        mock_services.installation = mock_installation
-        mock_installation_repository.get_installation_services.return_value = mock_services
-        
-        # Mock camera repository response
-        expected_images = {
-            "success": True,
-            "images": [
-                {"id": "img1", "url": "http://example.com/img1.jpg"},
-                {"id": "img2", "url": "http://example.com/img2.jpg"}
-            ],
-            "count": 2
-        }
-        mock_camera_repository.get_images.return_value = expected_images
-        
-        # Act
-        result = await create_dummy_use_case.create_dummy_camera_images(
-            installation_id, device, zone_id
+        mock_installation_repository.get_installation_services.return_value = _services(
+            _camera_device("1", "YR")
         )
-        
+
+        # Act
+        result = await create_dummy_use_case.create_dummy_camera_images(installation_id)
+
         # Assert
-        assert result == expected_images
+        assert result.total_cameras == 1
+        assert result.successful_refreshes == 1
+        assert [(d.camera_identifier, d.num_images) for d in result.refresh_data] == [
+            ("YR01", 4),
+        ]
+        (image_dir,) = (data_directory / "cameras" / "YR01").iterdir()
+        assert sorted(p.name for p in image_dir.iterdir()) == [
+            "1.jpg", "2.jpg", "3.jpg", "thumbnail.jpg"
+        ]
         mock_installation_repository.get_installation_services.assert_called_once_with(installation_id)
-        mock_camera_repository.get_images.assert_called_once_with(
-            installation_id=installation_id,
-            panel="PROTOCOL",
-            device=device,
-            zone_id=zone_id,
-            capabilities="default_capabilities"
-        )
 
     @pytest.mark.asyncio
-    async def test_create_dummy_camera_images_installation_error(self, create_dummy_use_case, mock_installation_repository):
+    async def test_create_dummy_camera_images_installation_error(self, create_dummy_use_case, mock_installation_repository, data_directory):
         """Test dummy camera images creation when installation services fail."""
         # Arrange
-        installation_id = "12345"
-        device = "device1"
-        zone_id = "zone1"
         mock_installation_repository.get_installation_services.side_effect = MyVerisureError("Installation not found")
-        
+
         # Act
-        result = await create_dummy_use_case.create_dummy_camera_images(
-            installation_id, device, zone_id
-        )
-        
+        result = await create_dummy_use_case.create_dummy_camera_images("12345")
+
         # Assert
-        assert result["success"] is False
-        assert "error" in result
-        assert "Installation not found" in result["error"]
+        assert result.total_cameras == 0
+        assert result.refresh_data == []
+        assert not (data_directory / "cameras").exists()
 
     @pytest.mark.asyncio
-    async def test_create_dummy_camera_images_camera_error(self, create_dummy_use_case, mock_camera_repository, mock_installation_repository):
-        """Test dummy camera images creation when camera request fails."""
+    async def test_create_dummy_camera_images_without_cameras(self, create_dummy_use_case, mock_installation_repository, data_directory):
+        """Test nothing is written when the installation has no cameras."""
         # Arrange
-        installation_id = "12345"
-        device = "device1"
-        zone_id = "zone1"
-        
-        # Mock installation services
-        mock_services = Mock()
-        mock_installation = Mock()
-        mock_installation.panel = "PROTOCOL"
-        mock_installation.capabilities = "default_capabilities"
-        mock_services.installation = mock_installation
-        mock_installation_repository.get_installation_services.return_value = mock_services
-        
-        # Mock camera repository failure
-        mock_camera_repository.get_images.return_value = {
-            "success": False,
-            "error": "Camera error",
-            "message": "Failed to get images"
-        }
-        
-        # Act
-        result = await create_dummy_use_case.create_dummy_camera_images(
-            installation_id, device, zone_id
+        mock_installation_repository.get_installation_services.return_value = _services(
+            _camera_device("1", "MG")
         )
-        
+
+        # Act
+        result = await create_dummy_use_case.create_dummy_camera_images("12345")
+
         # Assert
-        assert result["success"] is False
-        assert result["error"] == "Camera error"
-        assert result["message"] == "Failed to get images"
+        assert result.total_cameras == 0
+        assert not (data_directory / "cameras").exists()
+
+    def test_create_dummy_images_writes_black_jpegs(self, create_dummy_use_case, tmp_path):
+        """Test that the pre-built black JPEG is written for every dummy file."""
+        # Act
+        created = create_dummy_use_case._create_dummy_images(str(tmp_path))
+
+        # Assert
+        assert created == 4
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "1.jpg", "2.jpg", "3.jpg", "thumbnail.jpg"
+        ]
+        for image_path in tmp_path.iterdir():
+            data = image_path.read_bytes()
+            assert data.startswith(b"\xff\xd8") and data.endswith(b"\xff\xd9")
 
     @pytest.mark.asyncio
-    async def test_create_dummy_camera_images_with_special_parameters(self, create_dummy_use_case, mock_camera_repository, mock_installation_repository):
-        """Test dummy camera images creation with special parameters."""
+    async def test_create_dummy_camera_images_processes_each_camera(self, create_dummy_use_case, mock_installation_repository, data_directory):
+        """Test dummy images are created per camera and existing ones are skipped."""
         # Arrange
-        installation_id = "12345"
-        device = "device-1"
-        zone_id = "zone_1"
-        
-        # Mock installation services
-        mock_services = Mock()
-        mock_installation = Mock()
-        mock_installation.panel = "SDVFAST"
-        mock_installation.capabilities = "advanced_capabilities"
-        mock_services.installation = mock_installation
-        mock_installation_repository.get_installation_services.return_value = mock_services
-        
-        # Mock camera repository response
-        expected_images = {
-            "success": True,
-            "images": [],
-            "count": 0
-        }
-        mock_camera_repository.get_images.return_value = expected_images
-        
-        # Act
-        result = await create_dummy_use_case.create_dummy_camera_images(
-            installation_id, device, zone_id
+        mock_installation_repository.get_installation_services.return_value = _services(
+            _camera_device("1", "YR"), _camera_device("2", "YP"), _camera_device("3", "MG")
         )
-        
+        existing = data_directory / "cameras" / "YP02" / "2024-01-01_00-00-00"
+        existing.mkdir(parents=True)
+        (existing / "1.jpg").write_bytes(b"")
+
+        # Act
+        result = await create_dummy_use_case.create_dummy_camera_images("12345")
+
         # Assert
-        assert result == expected_images
-        mock_camera_repository.get_images.assert_called_once_with(
-            installation_id=installation_id,
-            panel="SDVFAST",
-            device=device,
-            zone_id=zone_id,
-            capabilities="advanced_capabilities"
-        )
+        assert result.total_cameras == 2
+        assert result.successful_refreshes == 1
+        assert [(d.camera_identifier, d.num_images) for d in result.refresh_data] == [
+            ("YR01", 4), ("YP02", 0)
+        ]
 
 
 if __name__ == "__main__":
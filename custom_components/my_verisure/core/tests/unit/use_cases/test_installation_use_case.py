@@ -4,7 +4,7 @@ Unit tests for InstallationUseCase implementation.
 """
 
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock
 
 from ....use_cases.implementations.installation_use_case_impl import (
     InstallationUseCaseImpl,
@@ -24,10 +24,7 @@ class TestInstallationUseCase:
     @pytest.fixture
     def mock_installation_repository(self):
         """Create a mock installation repository."""
-        mock_repo = Mock(spec=InstallationRepository)
-        mock_repo.get_installations = AsyncMock()
-        mock_repo.get_installation_services = AsyncMock()
-        return mock_repo
+        return Mock(spec=InstallationRepository)
 
     @pytest.fixture
     def installation_use_case(self, mock_installation_repository):
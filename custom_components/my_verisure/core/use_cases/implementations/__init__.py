@@ -3,9 +3,11 @@
 from .auth_use_case_impl import AuthUseCaseImpl
 from .installation_use_case_impl import InstallationUseCaseImpl
 from .alarm_use_case_impl import AlarmUseCaseImpl
+from .get_installation_devices_use_case_impl import GetInstallationDevicesUseCaseImpl
 
 __all__ = [
     "AuthUseCaseImpl",
     "InstallationUseCaseImpl",
     "AlarmUseCaseImpl",
+    "GetInstallationDevicesUseCaseImpl",
 ]
@@ -1,7 +1,7 @@
 """Authentication use case implementation."""
 
 import logging
-from typing import List
+from typing import List, Optional, Tuple
 
 from ...api.models.domain.auth import Auth, AuthResult
 from ...api.models.domain.session import DeviceIdentifiers
@@ -19,6 +19,7 @@ class AuthUseCaseImpl(AuthUseCase):
         """Initialize the use case with dependencies."""
         self.auth_repository = auth_repository
         self._otp_data = None
+        self._phones_cache: Optional[Tuple[dict, List[dict]]] = None
 
     async def login(self, username: str, password: str) -> AuthResult:
         """Login with username and password."""
@@ -82,6 +83,12 @@ class AuthUseCaseImpl(AuthUseCase):
 
     def get_available_phones(self) -> List[dict]:
         """Get available phone numbers for OTP."""
+        # The config flow polls this repeatedly while _otp_data stays the same
+        # object, so reuse the list built for it last time. Callers get copies,
+        # so changing a returned phone cannot leak into later results.
+        if self._phones_cache and self._phones_cache[0] is self._otp_data:
+            return [dict(phone) for phone in self._phones_cache[1]]
+
         _LOGGER.warning("Getting available phones from auth use case")
         _LOGGER.warning("AuthUseCase _otp_data: %s", self._otp_data)
         
@@ -95,7 +102,8 @@ class AuthUseCaseImpl(AuthUseCase):
             phones = self._otp_data.get("phones", [])
             result = [{"id": phone.get("id"), "phone": phone.get("phone"), "record_id": phone.get("record_id"), "otp_hash": phone.get("otp_hash")} for phone in phones]
             _LOGGER.warning("Returning %d phones from stored data", len(result))
-            return result
+            self._phones_cache = (self._otp_data, result)
+            return [dict(phone) for phone in result]
         else:
             # Fallback to client
             _LOGGER.warning("_otp_data is not a dict, delegating to client")
@@ -1,12 +1,17 @@
 """Create dummy camera images use case implementation."""
 
+import asyncio
+import base64
 import logging
 import os
+import shutil
+import zlib
 from datetime import datetime
-from PIL import Image
+from typing import Set, Tuple
 
 from ...api.models.domain.camera_refresh import CameraRefresh
 from ...api.models.domain.camera_refresh_data import CameraRefreshData
+from ...api.models.domain.device import Device
 from ...repositories.interfaces.installation_repository import InstallationRepository
 from ...file_manager import get_file_manager
 from ..interfaces.create_dummy_camera_images_use_case import CreateDummyCameraImagesUseCase
@@ -14,6 +19,27 @@ from ..interfaces.create_dummy_camera_images_use_case import CreateDummyCameraIm
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device types that are cameras
+_CAMERA_TYPES = frozenset({"YR", "YP"})
+
+# Files written for every camera that has no images yet
+_DUMMY_FILES = ("1.jpg", "2.jpg", "3.jpg", "thumbnail.jpg")
+
+# File extensions that count as an existing camera image.
+_IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif"})
+
+# Pre-built 1920x1080 black baseline JPEG (4:2:0, optimized Huffman tables),
+# stored zlib-compressed so the literal stays small. Written as-is for every
+# dummy file, so no image encoding happens at runtime.
+_BLACK_JPEG = zlib.decompress(
+    base64.b64decode(
+        b"eNrtzjtOAzEQgOEZvI4dZZXNZDcPRYlXrHIIOgqkSHApcgAORcEhSGi4iXHoeDQ0VP83"
+        b"kotf8tj5Nb/L7OFwfxBVES0j+U3uxLuqqpwvh/d+FOoYimYyGdfWzOfWmLXL7artNguz"
+        b"9fV6s9v1fd+uhv2Q9tvUp8sSLVfDKExjnKbOuvRn+VksVjfh6HSQK1Nnml9k8fnVL2LJ"
+        b"3ex7lUvVX6v9rGepnZZXnMmtPB0FAAAAAAAAAAAAAAAAAAAAAAD8t8d8+gDz+CQk"
+    )
+)
+
 
 class CreateDummyCameraImagesUseCaseImpl(CreateDummyCameraImagesUseCase):
     """Implementation of create dummy camera images use case."""
@@ -24,12 +50,19 @@ class CreateDummyCameraImagesUseCaseImpl(CreateDummyCameraImagesUseCase):
     ) -> None:
         """Initialize the create dummy camera images use case."""
         self.installation_repository = installation_repository
+        # Directories already created by this use case, so later refreshes
+        # can skip the makedirs stat/mkdir round trips.
+        self._known_dirs: Set[str] = set()
 
     async def create_dummy_camera_images(
         self,
         installation_id: str,
     ) -> CameraRefresh:
         """Create dummy images for cameras."""
+        # One clock read per invocation keeps every entry of the batch consistent
+        now = datetime.now()
+        timestamp = now.isoformat()
+        timestamp_dir = now.strftime("%Y-%m-%d_%H-%M-%S")
         try:
             _LOGGER.info(
                 "🎭 Creating dummy camera images for installation %s",
@@ -45,7 +78,7 @@ class CreateDummyCameraImagesUseCaseImpl(CreateDummyCameraImagesUseCase):
             # Filter devices to get only cameras (type "YR" or "YP")
             camera_devices = [
                 device for device in devices 
-                if device.type in ["YR", "YP"]
+                if device.type in _CAMERA_TYPES
             ]
             
             if not camera_devices:
@@ -55,83 +88,34 @@ class CreateDummyCameraImagesUseCaseImpl(CreateDummyCameraImagesUseCase):
                     total_cameras=0,
                     successful_refreshes=0,
                     failed_refreshes=0,
-                    timestamp=datetime.now().isoformat(),
+                    timestamp=timestamp,
                 )
             
-            refresh_data = []
-            successful_count = 0
-            
             # Get the data directory path
             data_path = get_file_manager().get_data_directory()
             cameras_dir = os.path.join(data_path, "cameras")
-            
+
             # Create cameras directory if it doesn't exist
-            os.makedirs(cameras_dir, exist_ok=True)
-            
-            for camera_device in camera_devices:
-                try:
-                    formatted_code = f"{camera_device.type}{int(camera_device.code):02d}"
-                    camera_dir = os.path.join(cameras_dir, formatted_code)
-                    
-                    # Check if camera already has images
-                    if self._camera_has_existing_images(camera_dir):
-                        _LOGGER.info(
-                            "⏭️ Camera %s (%s) already has images, skipping dummy creation",
-                            camera_device.name,
-                            formatted_code
-                        )
-                        
-                        refresh_data.append(
-                            CameraRefreshData(
-                                timestamp=datetime.now().isoformat(),
-                                num_images=0,
-                                camera_identifier=formatted_code,
-                            )
-                        )
-                        continue
-                    
-                    # Create camera directory if it doesn't exist
-                    os.makedirs(camera_dir, exist_ok=True)
-                    
-                    # Create timestamp directory (current date and time)
-                    now = datetime.now()
-                    timestamp_dir = now.strftime("%Y-%m-%d_%H-%M-%S")
-                    timestamp_path = os.path.join(camera_dir, timestamp_dir)
-                    os.makedirs(timestamp_path, exist_ok=True)
-                    
-                    # Create dummy black images
-                    dummy_images_created = self._create_dummy_images(timestamp_path)
-                    
-                    refresh_data.append(
-                        CameraRefreshData(
-                            timestamp=datetime.now().isoformat(),
-                            num_images=dummy_images_created,
-                            camera_identifier=formatted_code,
-                        )
-                    )
-                    
-                    successful_count += 1
-                    _LOGGER.info(
-                        "✅ Created %d dummy images for camera %s (%s)",
-                        dummy_images_created,
-                        camera_device.name,
-                        formatted_code
-                    )
+            if cameras_dir not in self._known_dirs:
+                await asyncio.to_thread(os.makedirs, cameras_dir, exist_ok=True)
+                self._known_dirs.add(cameras_dir)
 
-                except Exception as e:
-                    _LOGGER.error(
-                        "❌ Failed to create dummy images for camera %s: %s",
-                        camera_device.name,
-                        e,
-                    )
-                    
-                    refresh_data.append(
-                        CameraRefreshData(
-                            timestamp=datetime.now().isoformat(),
-                            num_images=0,
-                            camera_identifier=formatted_code,
-                        )
+            # Each camera only touches its own directory, so the blocking disk
+            # work runs concurrently off the event loop.
+            results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        self._process_camera,
+                        camera_device,
+                        cameras_dir,
+                        timestamp,
+                        timestamp_dir,
                     )
+                    for camera_device in camera_devices
+                )
+            )
+            refresh_data = [camera_data for camera_data, _ in results]
+            successful_count = sum(1 for _, created in results if created)
 
             _LOGGER.info(
                 "🎉 Dummy camera images creation completed for %d cameras",
@@ -143,7 +127,7 @@ class CreateDummyCameraImagesUseCaseImpl(CreateDummyCameraImagesUseCase):
                 total_cameras=len(camera_devices),
                 successful_refreshes=successful_count,
                 failed_refreshes=len(camera_devices) - successful_count,
-                timestamp=datetime.now().isoformat(),
+                timestamp=timestamp,
             )
 
         except Exception as e:
@@ -153,25 +137,103 @@ class CreateDummyCameraImagesUseCaseImpl(CreateDummyCameraImagesUseCase):
                 total_cameras=0,
                 successful_refreshes=0,
                 failed_refreshes=0,
-                timestamp=datetime.now().isoformat(),
+                timestamp=timestamp,
+            )
+
+    def _process_camera(
+        self,
+        camera_device: Device,
+        cameras_dir: str,
+        timestamp: str,
+        timestamp_dir: str,
+    ) -> Tuple[CameraRefreshData, bool]:
+        """Create dummy images for one camera, returning its data and success."""
+        formatted_code = camera_device.code
+        try:
+            formatted_code = camera_device.formatted_code
+            camera_dir = os.path.join(cameras_dir, formatted_code)
+
+            # Check if camera already has images
+            if self._camera_has_existing_images(camera_dir):
+                _LOGGER.info(
+                    "⏭️ Camera %s (%s) already has images, skipping dummy creation",
+                    camera_device.name,
+                    formatted_code
+                )
+                return (
+                    CameraRefreshData(
+                        timestamp=timestamp,
+                        num_images=0,
+                        camera_identifier=formatted_code,
+                    ),
+                    False,
+                )
+
+            # Create timestamp directory (current date and time); makedirs also
+            # creates the camera directory, so it needs no separate call.
+            timestamp_path = os.path.join(camera_dir, timestamp_dir)
+            os.makedirs(timestamp_path, exist_ok=True)
+
+            # Create dummy black images
+            dummy_images_created = self._create_dummy_images(timestamp_path)
+
+            _LOGGER.info(
+                "✅ Created %d dummy images for camera %s (%s)",
+                dummy_images_created,
+                camera_device.name,
+                formatted_code
+            )
+            return (
+                CameraRefreshData(
+                    timestamp=timestamp,
+                    num_images=dummy_images_created,
+                    camera_identifier=formatted_code,
+                ),
+                True,
+            )
+
+        except Exception as e:
+            _LOGGER.error(
+                "❌ Failed to create dummy images for camera %s: %s",
+                camera_device.name,
+                e,
+            )
+            return (
+                CameraRefreshData(
+                    timestamp=timestamp,
+                    num_images=0,
+                    camera_identifier=formatted_code,
+                ),
+                False,
             )
 
     def _camera_has_existing_images(self, camera_dir: str) -> bool:
         """Check if camera already has existing images."""
         try:
-            if not os.path.exists(camera_dir):
+            try:
+                camera_entries = os.scandir(camera_dir)
+            except (FileNotFoundError, NotADirectoryError):
                 return False
-            
-            # Look for any timestamp directories (YYYY-MM-DD_HH-MM-SS format)
-            for item in os.listdir(camera_dir):
-                item_path = os.path.join(camera_dir, item)
-                if os.path.isdir(item_path):
+
+            # Look for any timestamp directories (YYYY-MM-DD_HH-MM-SS format).
+            # scandir entries carry their file type, so no extra stat per item.
+            with camera_entries as items:
+                for item in items:
+                    if not item.is_dir(follow_symlinks=False):
+                        continue
                     # Check if this directory contains image files
-                    for file in os.listdir(item_path):
-                        if file.lower().endswith(('.jpg', '.jpeg', '.png', '.gif')):
-                            _LOGGER.debug("Found existing images in %s", item_path)
-                            return True
-            
+                    with os.scandir(item.path) as files:
+                        for file in files:
+                            name = file.name
+                            dot = name.rfind(".")
+                            if (
+                                dot != -1
+                                and name[dot:].lower() in _IMAGE_EXTENSIONS
+                                and file.is_file()
+                            ):
+                                _LOGGER.debug("Found existing images in %s", item.path)
+                                return True
+
             return False
             
         except Exception as e:
@@ -181,19 +243,26 @@ class CreateDummyCameraImagesUseCaseImpl(CreateDummyCameraImagesUseCase):
     def _create_dummy_images(self, directory_path: str) -> int:
         """Create dummy black images in the specified directory."""
         try:
-            # Create a black image (1920x1080 pixels)
-            black_image = Image.new('RGB', (1920, 1080), color='black')
-            
-            # Create the required dummy images
-            dummy_files = ['1.jpg', '2.jpg', '3.jpg', 'thumbnail.jpg']
-            images_created = 0
-            
-            for filename in dummy_files:
-                file_path = os.path.join(directory_path, filename)
-                black_image.save(file_path, 'JPEG', quality=85)
+            # Write the first dummy image, then hard-link the rest to it: the
+            # files are identical, so they can share one inode.
+            first_path = os.path.join(directory_path, _DUMMY_FILES[0])
+            with open(first_path, "wb") as f:
+                f.write(_BLACK_JPEG)
+            images_created = 1
+            _LOGGER.debug("Created dummy image: %s", first_path)
+
+            # Paths inside the loop reuse one precomputed directory prefix
+            prefix = directory_path + os.sep
+            for filename in _DUMMY_FILES[1:]:
+                file_path = prefix + filename
+                try:
+                    os.link(first_path, file_path)
+                except OSError:
+                    # Filesystems without hard-link support get a plain copy
+                    shutil.copyfile(first_path, file_path)
                 images_created += 1
                 _LOGGER.debug("Created dummy image: %s", file_path)
-            
+
             return images_created
             
         except Exception as e:
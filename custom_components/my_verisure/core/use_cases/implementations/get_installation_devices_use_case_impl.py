@@ -1,6 +1,7 @@
 """Get installation devices use case implementation."""
 
 import logging
+from collections import Counter
 from typing import List
 from ...api.models.domain.device import Device
 from ...repositories.interfaces.installation_repository import InstallationRepository
@@ -45,27 +46,23 @@ class GetInstallationDevicesUseCaseImpl(GetInstallationDevicesUseCase):
                 installation_id
             )
 
-            # Log device summary
             devices = detailed_installation.installation.devices
 
-            active_devices = [device for device in devices if device.is_active]
-            remote_devices = [device for device in devices if device.remote_use]
-            
-            _LOGGER.info(
-                "Device summary: %d total, %d active, %d remote accessible",
-                len(devices),
-                len(active_devices),
-                len(remote_devices)
-            )
+            # The summary is only for the log, so skip building it when INFO is off
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(
+                    "Device summary: %d total, %d active, %d remote accessible",
+                    len(devices),
+                    sum(1 for device in devices if device.is_active),
+                    sum(1 for device in devices if device.remote_use),
+                )
 
-            # Log device types
-            device_types = {}
-            for device in devices:
-                device_type = device.type
-                device_types[device_type] = device_types.get(device_type, 0) + 1
-            
-            if device_types:
-                _LOGGER.info("Device types: %s", device_types)
+                # Log device types
+                if devices:
+                    _LOGGER.info(
+                        "Device types: %s",
+                        dict(Counter(device.type for device in devices)),
+                    )
 
             return devices
 
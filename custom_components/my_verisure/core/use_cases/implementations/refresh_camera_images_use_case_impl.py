@@ -1,19 +1,97 @@
 """Refresh camera images use case implementation."""
 
 import asyncio
+import copy
 import logging
 import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
+from ...api.exceptions import MyVerisureError
 from ...api.models.domain.camera_refresh import CameraRefresh
 from ...api.models.domain.camera_refresh_data import CameraRefreshData
+from ...api.models.domain.device import Device
 from ...repositories.interfaces.camera_repository import CameraRepository
 from ...repositories.interfaces.installation_repository import InstallationRepository
+from ...utils.jwt_utils import get_jwt_payload
 from ..interfaces.refresh_camera_images_use_case import RefreshCameraImagesUseCase
 from datetime import datetime
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device types that are cameras
+_CAMERA_TYPES = frozenset({"YR", "YP"})
+
+# First wait (seconds) between image polls; doubles up to check_interval
+_INITIAL_POLL_DELAY = 0.5
+
+# Upper bounds (seconds) for a single camera API call. request_image already
+# polls the backend for the capture status, so it gets the larger budget.
+_REQUEST_TIMEOUT = 300.0
+_GET_TIMEOUT = 60.0
+
+# Seconds the panel, capabilities and camera list of an installation are reused
+_META_TTL = 300
+
+
+# Past request durations (seconds) kept per panel to shape the status polls
+_READY_SAMPLES = 50
+
+# Samples needed before the learned schedule replaces the fixed interval
+_MIN_READY_SAMPLES = 10
+
+# Status polls spread over the observed request durations
+_SCHEDULE_POLLS = 10
+
+# Shortest wait (seconds) between two status polls
+_MIN_POLL_DELAY = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class _CameraSetup:
+    """Installation data a camera refresh needs, cached until expires_at."""
+
+    panel: str
+    capabilities: str
+    camera_devices: List[Device]
+    device_codes: List[int]
+    expires_at: float
+
+
+def _poll_schedule_from_samples(samples: Iterable[float]) -> List[float]:
+    """Build status poll waits that split past request durations into equal shares.
+
+    Polls land on the deciles of the observed durations, so each poll has about
+    the same chance of being the one that finds the images ready. An extra probe
+    at half the fastest sample comes first: a sample can never be shorter than
+    the poll that observed it, so without it the estimate could not move down.
+    """
+    ordered = sorted(samples)
+    count = len(ordered)
+    poll_times = [ordered[0] / 2]
+    poll_times.extend(
+        ordered[max(0, count * share // _SCHEDULE_POLLS - 1)]
+        for share in range(1, _SCHEDULE_POLLS + 1)
+    )
+
+    schedule = []
+    elapsed = 0.0
+    for poll_time in poll_times:
+        delay = max(_MIN_POLL_DELAY, poll_time - elapsed)
+        schedule.append(delay)
+        elapsed += delay
+    return schedule
+
+
+def _camera_identifier(camera_device: Device) -> str:
+    """Return the camera identifier, falling back to the raw code if it is not numeric."""
+    try:
+        return camera_device.formatted_code
+    except ValueError:
+        return camera_device.code
+
 
 class RefreshCameraImagesUseCaseImpl(RefreshCameraImagesUseCase):
     """Implementation of refresh camera images use case."""
@@ -22,10 +100,40 @@ class RefreshCameraImagesUseCaseImpl(RefreshCameraImagesUseCase):
         self,
         camera_repository: CameraRepository,
         installation_repository: InstallationRepository,
+        max_concurrency: int = 8,
+        request_timeout: float = _REQUEST_TIMEOUT,
+        get_timeout: float = _GET_TIMEOUT,
     ) -> None:
         """Initialize the refresh camera images use case."""
         self.camera_repository = camera_repository
         self.installation_repository = installation_repository
+        # Caps in-flight camera API calls so large installations do not
+        # flood the HTTP connection pool or the backend.
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # A hung camera call gives up after these instead of the TCP timeout
+        self._request_timeout = request_timeout
+        self._get_timeout = get_timeout
+        # installation_id -> camera setup, expiring on the monotonic clock
+        self._meta_cache: Dict[str, _CameraSetup] = {}
+        self._meta_ttl = _META_TTL
+        # One lock per installation so concurrent cache misses fetch only once
+        self._meta_locks: Dict[str, asyncio.Lock] = {}
+        # Installations whose next fetch must bypass the repository cache too
+        self._force_refresh: Set[str] = set()
+        # Refreshes currently running, keyed by installation and polling
+        # parameters, so overlapping identical calls share one run
+        self._inflight: Dict[Tuple[str, int, int], asyncio.Task] = {}
+        # panel -> recent durations of successful image requests
+        self._ready_times: Dict[str, Deque[float]] = {}
+
+    def invalidate(self, installation_id: str) -> None:
+        """Drop the cached installation metadata so the next refresh refetches it.
+
+        The next fetch is a force refresh, so a stale copy held by the
+        installation repository is not picked up again either.
+        """
+        self._meta_cache.pop(installation_id, None)
+        self._force_refresh.add(installation_id)
 
     async def refresh_camera_images(
         self,
@@ -34,27 +142,66 @@ class RefreshCameraImagesUseCaseImpl(RefreshCameraImagesUseCase):
         check_interval: int = 4,
     ) -> CameraRefresh:
         """Refresh images from cameras."""
-        start_time = time.time()
+        key = (installation_id, max_attempts, check_interval)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._refresh_camera_images(
+                    installation_id, max_attempts, check_interval
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            _LOGGER.debug(
+                "Camera refresh already running for installation %s, joining it",
+                installation_id,
+            )
+        # Shielded so one caller being cancelled does not abort the others
+        result = await asyncio.shield(task)
+        # Each caller gets its own copy, so one mutating it cannot affect another
+        return copy.deepcopy(result)
+
+    async def refresh_many(
+        self,
+        installation_ids: List[str],
+        limit: int = 4,
+    ) -> Dict[str, CameraRefresh]:
+        """Refresh images from the cameras of several installations."""
+        # Installations overlap their waits, but only a few run at once so
+        # the backend does not rate-limit the account
+        semaphore = asyncio.Semaphore(limit)
+
+        async def refresh_one(installation_id: str) -> CameraRefresh:
+            async with semaphore:
+                return await self.refresh_camera_images(installation_id)
+
+        results = await asyncio.gather(
+            *(refresh_one(installation_id) for installation_id in installation_ids)
+        )
+        return dict(zip(installation_ids, results))
+
+    async def _refresh_camera_images(
+        self,
+        installation_id: str,
+        max_attempts: int,
+        check_interval: int,
+    ) -> CameraRefresh:
+        """Run one camera refresh for an installation."""
+        start_time = time.perf_counter()
+        # One clock read per invocation keeps every entry of the batch consistent
+        timestamp = datetime.now().isoformat()
         try:
             _LOGGER.info(
                 "📸 Refreshing camera images for installation %s",
                 installation_id,
             )
 
-            # Get installation services to get panel and capabilities
-            detailed_installation = await self.installation_repository.get_installation_services(
-                installation_id
-            )
-            panel = detailed_installation.installation.panel or "SDVFAST"
-            capabilities = detailed_installation.installation.capabilities or "default_capabilities"
-            devices = detailed_installation.installation.devices
-            
-            # Filter devices to get only cameras (type "YR" or "YP")
-            camera_devices = [
-                device for device in devices 
-                if device.type in ["YR", "YP"]
-            ]
-            
+            setup = await self._get_camera_setup(installation_id)
+            panel = setup.panel
+            capabilities = setup.capabilities
+            camera_devices = setup.camera_devices
+
             if not camera_devices:
                 _LOGGER.warning("⚠️ No active camera devices (YR/YP) found in installation %s", installation_id)
                 return CameraRefresh(
@@ -62,63 +209,70 @@ class RefreshCameraImagesUseCaseImpl(RefreshCameraImagesUseCase):
                     total_cameras=0,
                     successful_refreshes=0,
                     failed_refreshes=0,
-                    timestamp=datetime.now().isoformat(),
+                    timestamp=timestamp,
                 )
             
-            refresh_data = []
-            index = 0
-            for camera_device in camera_devices:
-                try:
-                    result = await self.camera_repository.request_image(
-                        installation_id=installation_id,
-                        panel=panel,
-                        devices=[int(camera_device.code)],
-                        capabilities=capabilities,
-                    )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Camera devices: %s",
+                    [device.dict() for device in camera_devices],
+                )
+
+            # One request covers every camera: the backend captures them
+            # under a single reference and reports the status once for all
+            successful_requests = await self._request_images(
+                device_codes=setup.device_codes,
+                installation_id=installation_id,
+                panel=panel,
+                capabilities=capabilities,
+            )
 
-                    formatted_code = f"{camera_device.type}{int(camera_device.code):02d}"
-                    if (result.successful_requests > 0):
-                        _LOGGER.info("⏳ Waiting 3 seconds before retrieving images from camera %s...", formatted_code)
-                        await asyncio.sleep(3)
+            # Nothing was captured, so there is nothing to poll for
+            if not successful_requests:
+                _LOGGER.warning(
+                    "⚠️ No camera accepted the image request in installation %s",
+                    installation_id,
+                )
+                return CameraRefresh(
+                    refresh_data=[],
+                    total_cameras=len(camera_devices),
+                    successful_refreshes=0,
+                    failed_refreshes=len(camera_devices),
+                    timestamp=timestamp,
+                )
 
-                        image_result = await self.camera_repository.get_images(
+            # Image retrieval is independent per camera. Errors are recorded
+            # per camera inside _retrieve_camera_images, so one failing camera
+            # never cancels the others; only cancellation escapes it.
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [
+                    task_group.create_task(
+                        self._retrieve_camera_images(
+                            camera_device=camera_device,
                             installation_id=installation_id,
                             panel=panel,
-                            device=camera_device.type,
-                            zone_id=formatted_code,
                             capabilities=capabilities,
+                            max_attempts=max_attempts,
+                            check_interval=check_interval,
+                            timestamp=timestamp,
                         )
-                        
-                        refresh_data.append(
-                            CameraRefreshData(
-                                timestamp=datetime.now().isoformat(),
-                                num_images=image_result.get("images_saved", 0),
-                                camera_identifier=formatted_code,
-                            )
-                        )
-
-                        index = index + result.successful_requests
+                    )
+                    for camera_device in camera_devices
+                ]
+            results = [task.result() for task in tasks]
 
-                        _LOGGER.info(
-                            "✅ Camera images requests completed. Successful requests: %d/%d",
-                            index,
-                            len(camera_devices)
-                        )
+            # One pass over the per-camera flags gives both data and count
+            refresh_data = []
+            successful_count = 0
+            for camera_data, refreshed in results:
+                refresh_data.append(camera_data)
+                successful_count += refreshed
 
-                except Exception as e:
-                    _LOGGER.error(
-                        "❌ Failed to retrieve images from camera %s: %s",
-                        camera_device.name,
-                        e,
-                    )
-                    
-                    refresh_data.append(
-                        CameraRefreshData(
-                            timestamp=datetime.now().isoformat(),
-                            num_images=0,
-                            camera_identifier=formatted_code,
-                        )
-                    )
+            _LOGGER.debug(
+                "✅ Camera images requests completed. Successful cameras: %d/%d",
+                successful_count,
+                len(camera_devices)
+            )
 
             _LOGGER.info(
                 "🎉 Camera images retrieval completed for %d cameras",
@@ -126,7 +280,7 @@ class RefreshCameraImagesUseCaseImpl(RefreshCameraImagesUseCase):
             )
             
             # Calculate total execution time
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             _LOGGER.info(
                 "⏱️ Total execution time: %.2f seconds",
                 total_time
@@ -136,14 +290,14 @@ class RefreshCameraImagesUseCaseImpl(RefreshCameraImagesUseCase):
             return CameraRefresh(
                 refresh_data=refresh_data,
                 total_cameras=len(camera_devices),
-                successful_refreshes=index,
-                failed_refreshes=len(camera_devices) - index,
-                timestamp=datetime.now().isoformat(),
+                successful_refreshes=successful_count,
+                failed_refreshes=len(camera_devices) - successful_count,
+                timestamp=timestamp,
             )
 
         except Exception as e:
             # Calculate total execution time even in case of error
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             _LOGGER.error("💥 Failed to refresh camera images: %s", e)
             _LOGGER.info(
                 "⏱️ Total execution time (with error): %.2f seconds",
@@ -155,5 +309,244 @@ class RefreshCameraImagesUseCaseImpl(RefreshCameraImagesUseCase):
                 total_cameras=0,
                 successful_refreshes=0,
                 failed_refreshes=0,
-                timestamp=datetime.now().isoformat(),
+                timestamp=timestamp,
+            )
+
+    async def _get_camera_setup(self, installation_id: str) -> _CameraSetup:
+        """Return panel, capabilities and camera devices, cached for a short TTL."""
+        cached = self._cached_camera_setup(installation_id)
+        if cached is not None:
+            return cached
+
+        lock = self._meta_locks.setdefault(installation_id, asyncio.Lock())
+        async with lock:
+            # Another caller may have filled the cache while we waited
+            cached = self._cached_camera_setup(installation_id)
+            if cached is not None:
+                return cached
+
+            # Get installation services to get panel and capabilities
+            force_refresh = installation_id in self._force_refresh
+            detailed_installation = await self.installation_repository.get_installation_services(
+                installation_id, force_refresh=force_refresh
+            )
+            self._force_refresh.discard(installation_id)
+            panel = detailed_installation.installation.panel or "SDVFAST"
+            capabilities = detailed_installation.installation.capabilities or "default_capabilities"
+            devices = detailed_installation.installation.devices
+
+            # Filter devices to get only cameras (type "YR" or "YP") that can be
+            # reached remotely; the others would only fail the image request.
+            # The request codes are collected in the same pass; a camera whose
+            # code is not numeric cannot be requested and is left out.
+            camera_devices = []
+            device_codes = []
+            for device in devices:
+                if device.type in _CAMERA_TYPES and device.remote_use:
+                    try:
+                        device_code = int(device.code)
+                    except (TypeError, ValueError):
+                        _LOGGER.warning(
+                            "⚠️ Skipping camera %s with non-numeric code %r",
+                            device.name,
+                            device.code,
+                        )
+                        continue
+                    camera_devices.append(device)
+                    device_codes.append(device_code)
+
+            # Never keep the entry past the expiry of the capabilities token
+            lifetime = float(self._meta_ttl)
+            payload = get_jwt_payload(capabilities)
+            if payload and "exp" in payload:
+                lifetime = min(lifetime, payload["exp"] - time.time() - 30)
+            setup = _CameraSetup(
+                panel=panel,
+                capabilities=capabilities,
+                camera_devices=camera_devices,
+                device_codes=device_codes,
+                expires_at=time.monotonic() + lifetime,
             )
+            self._meta_cache[installation_id] = setup
+            return setup
+
+    def _cached_camera_setup(self, installation_id: str) -> Optional[_CameraSetup]:
+        """Return the cached camera setup if it has not expired yet."""
+        setup = self._meta_cache.get(installation_id)
+        if setup is None:
+            return None
+        if time.monotonic() >= setup.expires_at:
+            del self._meta_cache[installation_id]
+            return None
+        return setup
+
+    async def _request_images(
+        self,
+        device_codes: List[int],
+        installation_id: str,
+        panel: str,
+        capabilities: str,
+    ) -> int:
+        """Ask all cameras to capture new images, returning the successful requests."""
+        # Until enough history exists the client keeps its fixed status interval
+        samples = self._ready_times.get(panel)
+        poll_schedule = (
+            _poll_schedule_from_samples(samples)
+            if samples is not None and len(samples) >= _MIN_READY_SAMPLES
+            else None
+        )
+        try:
+            async with self._semaphore:
+                started = time.perf_counter()
+                request_result = await asyncio.wait_for(
+                    self.camera_repository.request_image(
+                        installation_id=installation_id,
+                        panel=panel,
+                        devices=device_codes,
+                        capabilities=capabilities,
+                        poll_schedule=poll_schedule,
+                    ),
+                    timeout=self._request_timeout,
+                )
+                elapsed = time.perf_counter() - started
+        except TimeoutError:
+            _LOGGER.error(
+                "⌛ Timed out after %.0f seconds requesting images from %d cameras",
+                self._request_timeout,
+                len(device_codes),
+            )
+            return 0
+        except MyVerisureError as e:
+            _LOGGER.error("❌ Failed to request images from cameras: %s", e)
+            # A rejected request is often down to a stale panel or capabilities
+            # token, so the next refresh fetches the installation again
+            self.invalidate(installation_id)
+            return 0
+
+        if request_result.successful_requests:
+            self._ready_times.setdefault(
+                panel, deque(maxlen=_READY_SAMPLES)
+            ).append(elapsed)
+        return request_result.successful_requests
+
+    async def _retrieve_camera_images(
+        self,
+        camera_device: Device,
+        installation_id: str,
+        panel: str,
+        capabilities: str,
+        max_attempts: int,
+        check_interval: int,
+        timestamp: str,
+    ) -> Tuple[CameraRefreshData, bool]:
+        """Retrieve images for one camera, returning its data and success."""
+        camera_identifier = _camera_identifier(camera_device)
+        try:
+            image_result = await self._wait_for_images(
+                installation_id=installation_id,
+                panel=panel,
+                device=camera_device.type,
+                zone_id=camera_identifier,
+                capabilities=capabilities,
+                max_attempts=max_attempts,
+                check_interval=check_interval,
+            )
+        except TimeoutError:
+            _LOGGER.error(
+                "⌛ Timed out after %.0f seconds retrieving images from camera %s",
+                self._get_timeout,
+                camera_device.name,
+            )
+            return (
+                CameraRefreshData(
+                    timestamp=timestamp,
+                    num_images=0,
+                    camera_identifier=camera_identifier,
+                ),
+                False,
+            )
+        except MyVerisureError as e:
+            _LOGGER.error(
+                "❌ Failed to retrieve images from camera %s: %s",
+                camera_device.name,
+                e,
+            )
+            return (
+                CameraRefreshData(
+                    timestamp=timestamp,
+                    num_images=0,
+                    camera_identifier=camera_identifier,
+                ),
+                False,
+            )
+        except Exception as e:
+            # CancelledError is not an Exception, so cancellation still propagates
+            _LOGGER.error(
+                "💥 Unexpected error retrieving images from camera %s: %s",
+                camera_device.name,
+                e,
+            )
+            return (
+                CameraRefreshData(
+                    timestamp=timestamp,
+                    num_images=0,
+                    camera_identifier=camera_identifier,
+                ),
+                False,
+            )
+
+        num_images = image_result.get("images_saved", 0)
+        if not num_images:
+            _LOGGER.warning(
+                "⚠️ Camera %s saved no images after %d attempts",
+                camera_device.name,
+                max_attempts,
+            )
+        return (
+            CameraRefreshData(
+                timestamp=timestamp,
+                num_images=num_images,
+                camera_identifier=camera_identifier,
+            ),
+            num_images > 0,
+        )
+
+    async def _wait_for_images(
+        self,
+        installation_id: str,
+        panel: str,
+        device: str,
+        zone_id: str,
+        capabilities: str,
+        max_attempts: int,
+        check_interval: int,
+    ) -> Dict[str, Any]:
+        """Poll get_images until the camera has saved images, backing off between tries."""
+        image_result: Dict[str, Any] = {}
+        delay = _INITIAL_POLL_DELAY
+        for attempt in range(max_attempts):
+            # Only the API call holds a slot; the backoff sleep does not
+            async with self._semaphore:
+                image_result = await asyncio.wait_for(
+                    self.camera_repository.get_images(
+                        installation_id=installation_id,
+                        panel=panel,
+                        device=device,
+                        zone_id=zone_id,
+                        capabilities=capabilities,
+                    ),
+                    timeout=self._get_timeout,
+                )
+            if image_result.get("images_saved"):
+                return image_result
+
+            if attempt + 1 < max_attempts:
+                _LOGGER.debug(
+                    "⏳ No images yet from camera %s, retrying in %.1f seconds...",
+                    zone_id,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, check_interval)
+
+        return image_result
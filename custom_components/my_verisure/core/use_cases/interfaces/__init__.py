@@ -3,9 +3,11 @@
 from .auth_use_case import AuthUseCase
 from .installation_use_case import InstallationUseCase
 from .alarm_use_case import AlarmUseCase
+from .get_installation_devices_use_case import GetInstallationDevicesUseCase
 
 __all__ = [
     "AuthUseCase",
     "InstallationUseCase",
     "AlarmUseCase",
+    "GetInstallationDevicesUseCase",
 ]
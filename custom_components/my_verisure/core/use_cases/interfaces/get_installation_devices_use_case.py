@@ -1,9 +1,9 @@
 """Get installation devices use case interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List
 
-from ...api.models.domain.device import DeviceList
+from ...api.models.domain.device import Device
 
 
 class GetInstallationDevicesUseCase(ABC):
@@ -14,6 +14,6 @@ class GetInstallationDevicesUseCase(ABC):
         self, 
         installation_id: str, 
         force_refresh: bool = False
-    ) -> DeviceList:
+    ) -> List[Device]:
         """Get devices for an installation."""
         pass
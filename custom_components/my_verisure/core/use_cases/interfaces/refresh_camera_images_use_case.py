@@ -1,8 +1,9 @@
 """Refresh camera images use case interface."""
 
 from abc import ABC, abstractmethod
+from typing import Dict, List
 
-from ...api.models.domain.camera_request_image import CameraRequestImageResult
+from ...api.models.domain.camera_refresh import CameraRefresh
 
 
 class RefreshCameraImagesUseCase(ABC):
@@ -14,6 +15,15 @@ class RefreshCameraImagesUseCase(ABC):
         installation_id: str,
         max_attempts: int = 30,
         check_interval: int = 4,
-    ) -> CameraRequestImageResult:
+    ) -> CameraRefresh:
         """Refresh images from cameras."""
         pass
+
+    @abstractmethod
+    async def refresh_many(
+        self,
+        installation_ids: List[str],
+        limit: int = 4,
+    ) -> Dict[str, CameraRefresh]:
+        """Refresh images from the cameras of several installations."""
+        pass
@@ -1,24 +1,44 @@
 """JWT utility functions for My Verisure integration."""
 
+import base64
+import functools
+import json
 import logging
 import time
 from typing import Optional, Dict, Any
 
-try:
-    import jwt
-except ImportError:
-    jwt = None
-
 _LOGGER = logging.getLogger(__name__)
 
 
-def is_jwt_expired(token: str, leeway: int = 30) -> bool:
+@functools.lru_cache(maxsize=32)
+def _decode_payload(token: str) -> Dict[str, Any]:
+    """Decode a JWT payload without verification, once per distinct token.
+
+    Raises ValueError if the token is not a well-formed JWT.
+    """
+    segments = token.split(".")
+    if len(segments) != 3:
+        raise ValueError("Not enough segments")
+    payload_b64 = segments[1]
+    payload = json.loads(
+        base64.urlsafe_b64decode(payload_b64 + "=" * (-len(payload_b64) % 4))
+    )
+    if not isinstance(payload, dict):
+        raise ValueError("Payload is not a JSON object")
+    return payload
+
+
+def is_jwt_expired(
+    token: str, leeway: int = 30, now: Optional[float] = None
+) -> bool:
     """
     Check if a JWT token has expired.
     
     Args:
         token: The JWT token to check
         leeway: Number of seconds of leeway for expiration check
+        now: Current wall-clock time, so callers can share one clock read
+            across several checks; read from time.time() when omitted
         
     Returns:
         True if token is expired or invalid, False if still valid
@@ -26,15 +46,11 @@ def is_jwt_expired(token: str, leeway: int = 30) -> bool:
     if not token:
         _LOGGER.debug("No token provided")
         return True
-        
-    if jwt is None:
-        _LOGGER.warning("PyJWT not available, cannot validate JWT expiration")
-        return False
-    
+
     try:
         # Decode the token without verification to get the payload
         # We only need to check the expiration, not verify the signature
-        payload = jwt.decode(token, options={"verify_signature": False})
+        payload = _decode_payload(token)
         
         # Check if token has expiration claim
         if "exp" not in payload:
@@ -42,7 +58,7 @@ def is_jwt_expired(token: str, leeway: int = 30) -> bool:
             return False
             
         # Get current time
-        current_time = time.time()
+        current_time = time.time() if now is None else now
         expiration_time = payload["exp"]
         
         # Check if token is expired (with leeway)
@@ -57,7 +73,7 @@ def is_jwt_expired(token: str, leeway: int = 30) -> bool:
             
         return is_expired
         
-    except jwt.InvalidTokenError as e:
+    except ValueError as e:
         _LOGGER.warning("Invalid JWT token: %s", e)
         return True
     except Exception as e:
@@ -75,11 +91,12 @@ def get_jwt_payload(token: str) -> Optional[Dict[str, Any]]:
     Returns:
         The token payload or None if invalid
     """
-    if not token or jwt is None:
+    if not token:
         return None
         
     try:
-        return jwt.decode(token, options={"verify_signature": False})
+        # Copy so callers cannot alter the memoised payload
+        return dict(_decode_payload(token))
     except Exception as e:
         _LOGGER.debug("Error decoding JWT payload: %s", e)
         return None
@@ -6,10 +6,15 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
+from .core.api.base_client import close_shared_session
 from .core.const import DOMAIN, LOGGER, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
 from .coordinator import MyVerisureDataUpdateCoordinator
 from .device import async_setup_device
-from .services import async_setup_services, async_unload_services
+from .services import (
+    COORDINATORS_BY_INSTALLATION,
+    async_setup_services,
+    async_unload_services,
+)
 
 PLATFORMS: list[Platform] = [
     Platform.ALARM_CONTROL_PANEL,
@@ -41,6 +46,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data[DOMAIN].setdefault(COORDINATORS_BY_INSTALLATION, {})[
+        coordinator.installation_id
+    ] = coordinator
 
     # Set up the device
     await async_setup_device(hass, entry)
@@ -94,11 +102,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not unload_ok:
         return False
 
-    del hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+    coordinators = hass.data[DOMAIN].get(COORDINATORS_BY_INSTALLATION, {})
+    # Another entry may have claimed the same installation since this one loaded
+    if coordinators.get(coordinator.installation_id) is coordinator:
+        del coordinators[coordinator.installation_id]
 
     # Unload services if no more entries
-    if not hass.data[DOMAIN]:
+    remaining_entries = [
+        value
+        for value in hass.data[DOMAIN].values()
+        if isinstance(value, MyVerisureDataUpdateCoordinator)
+    ]
+    if not remaining_entries:
         await async_unload_services(hass)
         del hass.data[DOMAIN]
+        await close_shared_session()
 
     return True 
\ No newline at end of file
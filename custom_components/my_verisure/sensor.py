@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 from datetime import datetime, timezone
+from itertools import product
+from types import MappingProxyType
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .core.const import DOMAIN, LOGGER, ENTITY_NAMES
@@ -18,6 +21,44 @@ from .coordinator import MyVerisureDataUpdateCoordinator
 from .device import get_device_info
 
 
+# Shared read-only stand-in for missing sections of the alarm status data
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _alarm_modes(alarm_data: Mapping[str, Any]) -> tuple[Any, Any, Any, Any]:
+    """Return the internal day, night, total and external alarm statuses."""
+    internal = alarm_data.get("internal") or _EMPTY
+    external = alarm_data.get("external") or _EMPTY
+    return (
+        (internal.get("day") or _EMPTY).get("status", False),
+        (internal.get("night") or _EMPTY).get("status", False),
+        (internal.get("total") or _EMPTY).get("status", False),
+        external.get("status", False),
+    )
+
+
+def _alarm_status_label(
+    internal_day: bool, internal_night: bool, internal_total: bool, external: bool
+) -> str:
+    """Return the general alarm status label for a combination of modes."""
+    if internal_total:
+        return "Total and Perimeter Active" if external else "Total Internal Active"
+    if internal_day:
+        return "Internal Day and Perimeter Active" if external else "Internal Day Active"
+    if internal_night:
+        return "Internal Night and Perimeter Active" if external else "Internal Night Active"
+    if external:
+        return "Perimeter Active"
+    return "Alarm Disarmed"
+
+
+# Label for every (internal_day, internal_night, internal_total, external)
+# combination, so the status sensor resolves its state with one lookup
+_ALARM_STATUS_LABELS: dict[tuple[bool, bool, bool, bool], str] = {
+    modes: _alarm_status_label(*modes) for modes in product((False, True), repeat=4)
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -28,10 +69,8 @@ async def async_setup_entry(
         config_entry.entry_id
     ]
 
-    entities = []
-
     # Create alarm status sensors
-    entities.extend([
+    async_add_entities([
         # General Alarm Status Sensor
         MyVerisureAlarmStatusSensor(
             coordinator,
@@ -62,8 +101,6 @@ async def async_setup_entry(
         ),
     ])
 
-    async_add_entities(entities)
-
 
 class MyVerisureAlarmStatusSensor(SensorEntity):
     """Representation of My Verisure alarm status sensor."""
@@ -77,8 +114,9 @@ class MyVerisureAlarmStatusSensor(SensorEntity):
     ) -> None:
         """Initialize the alarm status sensor."""
         self.coordinator = coordinator
-        self.config_entry = config_entry
         self.sensor_id = sensor_id
+        # The installation never changes for an entry, so resolve it once
+        self._installation_id = config_entry.data.get("installation_id", "Unknown")
         
         self._attr_name = friendly_name
         self._attr_unique_id = f"{config_entry.entry_id}_{sensor_id}"
@@ -89,68 +127,44 @@ class MyVerisureAlarmStatusSensor(SensorEntity):
         # Set device info
         self._attr_device_info = get_device_info(config_entry)
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Recompute the state and attributes from the coordinator data."""
+        self._attr_extra_state_attributes = {}
+        data = self.coordinator.data
+        if not data:
+            self._attr_native_value = None
+            return
 
-        alarm_status = self.coordinator.data.get("alarm_status", {})
+        alarm_status = data.get("alarm_status", {})
         if not alarm_status:
-            return "Desconocido"
+            self._attr_native_value = "Desconocido"
+            return
 
-        # Analizar el estado de la alarma
         # Los datos están en alarm_status.data
-        alarm_data = alarm_status.get("data", {})
-        internal = alarm_data.get("internal", {})
-        external = alarm_data.get("external", {})
-        
-        # Determinar el estado general
-        internal_day = internal.get("day", {}).get("status", False)
-        internal_night = internal.get("night", {}).get("status", False)
-        internal_total = internal.get("total", {}).get("status", False)
-        external_status = external.get("status", False)
-        
-        if internal_total and external_status:
-            return "Total and Perimeter Active"
-        elif internal_total:
-            return "Total Internal Active"
-        elif internal_day and external_status:
-            return "Internal Day and Perimeter Active"
-        elif internal_day:
-            return "Internal Day Active"
-        elif internal_night:
-            return "Internal Night Active"
-        elif internal_night and external_status:
-            return "Internal Night and Perimeter Active"
-        elif external_status:
-            return "Perimeter Active"
-        else:
-            return "Alarm Disarmed"
+        alarm_data = alarm_status.get("data") or _EMPTY
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not self.coordinator.data:
-            return {}
-
-        alarm_status = self.coordinator.data.get("alarm_status", {})
-        if not alarm_status:
-            return {}
+        internal_day, internal_night, internal_total, external_status = (
+            _alarm_modes(alarm_data)
+        )
 
-        # Los datos están en alarm_status.data
-        alarm_data = alarm_status.get("data", {})
-        internal = alarm_data.get("internal", {})
-        external = alarm_data.get("external", {})
-        
-        return {
-            "internal_day_status": internal.get("day", {}).get("status", False),
-            "internal_night_status": internal.get("night", {}).get("status", False),
-            "internal_total_status": internal.get("total", {}).get("status", False),
-            "external_status": external.get("status", False),
-            "installation_id": self.config_entry.data.get("installation_id", "Unknown"),
+        self._attr_native_value = _ALARM_STATUS_LABELS[
+            (bool(internal_day), bool(internal_night), bool(internal_total), bool(external_status))
+        ]
+        self._attr_extra_state_attributes = {
+            "internal_day_status": internal_day,
+            "internal_night_status": internal_night,
+            "internal_total_status": internal_total,
+            "external_status": external_status,
+            "installation_id": self._installation_id,
         }
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
@@ -159,8 +173,9 @@ class MyVerisureAlarmStatusSensor(SensorEntity):
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
+        self._update_from_coordinator()
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
         )
 
 
@@ -176,8 +191,9 @@ class MyVerisureActiveAlarmsSensor(SensorEntity):
     ) -> None:
         """Initialize the active alarms sensor."""
         self.coordinator = coordinator
-        self.config_entry = config_entry
         self.sensor_id = sensor_id
+        # The installation never changes for an entry, so resolve it once
+        self._installation_id = config_entry.data.get("installation_id", "Unknown")
         
         self._attr_name = friendly_name
         self._attr_unique_id = f"{config_entry.entry_id}_{sensor_id}"
@@ -191,26 +207,24 @@ class MyVerisureActiveAlarmsSensor(SensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return "Sin datos"
 
-        alarm_status = self.coordinator.data.get("alarm_status", {})
+        alarm_status = data.get("alarm_status", {})
         if not alarm_status:
             return "Desconectado"
 
         # Analizar el estado de la alarma
         # Los datos están en alarm_status.data
-        alarm_data = alarm_status.get("data", {})
-        internal = alarm_data.get("internal", {})
-        external = alarm_data.get("external", {})
+        alarm_data = alarm_status.get("data") or _EMPTY
         
         # Determinar qué alarmas están activas
         active_alarms = []
         
-        internal_day = internal.get("day", {}).get("status", False)
-        internal_night = internal.get("night", {}).get("status", False)
-        internal_total = internal.get("total", {}).get("status", False)
-        external_status = external.get("status", False)
+        internal_day, internal_night, internal_total, external_status = (
+            _alarm_modes(alarm_data)
+        )
         
         if internal_total:
             active_alarms.append("Internal Total")
@@ -231,26 +245,24 @@ class MyVerisureActiveAlarmsSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return {}
 
-        alarm_status = self.coordinator.data.get("alarm_status", {})
+        alarm_status = data.get("alarm_status", {})
         if not alarm_status:
             return {}
 
         # Analyze alarm state
         # Los datos están en alarm_status.data
-        alarm_data = alarm_status.get("data", {})
-        internal = alarm_data.get("internal", {})
-        external = alarm_data.get("external", {})
+        alarm_data = alarm_status.get("data") or _EMPTY
         
         # Determine which alarms are active
         active_alarms = []
         
-        internal_day = internal.get("day", {}).get("status", False)
-        internal_night = internal.get("night", {}).get("status", False)
-        internal_total = internal.get("total", {}).get("status", False)
-        external_status = external.get("status", False)
+        internal_day, internal_night, internal_total, external_status = (
+            _alarm_modes(alarm_data)
+        )
         
         if internal_total:
             active_alarms.append("Internal Total")
@@ -268,7 +280,7 @@ class MyVerisureActiveAlarmsSensor(SensorEntity):
             "internal_night_active": internal_night,
             "internal_total_active": internal_total,
             "external_active": external_status,
-            "installation_id": self.config_entry.data.get("installation_id", "Unknown"),
+            "installation_id": self._installation_id,
         }
 
     @property
@@ -296,14 +308,17 @@ class MyVerisureLastUpdatedSensor(SensorEntity):
     ) -> None:
         """Initialize the last updated sensor."""
         self.coordinator = coordinator
-        self.config_entry = config_entry
         self.sensor_id = sensor_id
+        # The installation never changes for an entry, so resolve it once
+        self._installation_id = config_entry.data.get("installation_id", "Unknown")
         
         self._attr_name = friendly_name
         self._attr_unique_id = f"{config_entry.entry_id}_{sensor_id}"
         self._attr_device_class = SensorDeviceClass.TIMESTAMP
         self._attr_state_class = None
         self._attr_should_poll = False
+        self._cached_timestamp: float | None = None
+        self._cached_datetime: datetime | None = None
         
         # Set device info
         self._attr_device_info = get_device_info(config_entry)
@@ -311,34 +326,49 @@ class MyVerisureLastUpdatedSensor(SensorEntity):
     @property
     def native_value(self) -> datetime | None:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
 
-        last_updated = self.coordinator.data.get("last_updated")
+        last_updated = data.get("last_updated")
         if last_updated is None:
             return None
 
+        # The timestamp only changes on a coordinator refresh, so reuse the
+        # converted value until it does
+        if last_updated == self._cached_timestamp:
+            return self._cached_datetime
+
         try:
             # Convertir timestamp a datetime
             result = datetime.fromtimestamp(last_updated, timezone.utc)
-            return result
         except (ValueError, TypeError) as e:
             LOGGER.error("LastUpdatedSensor: Error converting timestamp %s: %s", last_updated, e)
-            return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not self.coordinator.data:
-            return {}
-
-        last_updated = self.coordinator.data.get("last_updated")
-        
-        return {
-            "timestamp": last_updated,
-            "installation_id": self.config_entry.data.get("installation_id", "Unknown"),
+            result = None
+
+        self._cached_timestamp = last_updated
+        self._cached_datetime = result
+        return result
+
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Recompute the attributes from the coordinator data."""
+        data = self.coordinator.data
+        if not data:
+            self._attr_extra_state_attributes = {}
+            return
+
+        self._attr_extra_state_attributes = {
+            "timestamp": data.get("last_updated"),
+            "installation_id": self._installation_id,
         }
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
@@ -347,8 +377,9 @@ class MyVerisureLastUpdatedSensor(SensorEntity):
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
+        self._update_from_coordinator()
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
         ) 
 
 
@@ -364,8 +395,13 @@ class MyVerisurePanelStateSensor(SensorEntity):
     ) -> None:
         """Initialize the panel state sensor."""
         self.coordinator = coordinator
-        self.config_entry = config_entry
         self.sensor_id = sensor_id
+        # The installation never changes for an entry, so resolve it once
+        self._installation_id = config_entry.data.get("installation_id", "Unknown")
+        self._alarm_panel_entity_id = (
+            "alarm_control_panel.my_verisure_alarm_"
+            f"{config_entry.data.get('installation_id', 'unknown')}"
+        )
         
         self._attr_name = friendly_name
         self._attr_unique_id = f"{config_entry.entry_id}_{sensor_id}"
@@ -379,22 +415,20 @@ class MyVerisurePanelStateSensor(SensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return "unavailable"
 
-        alarm_status = self.coordinator.data.get("alarm_status", {})
+        alarm_status = data.get("alarm_status", {})
         if not alarm_status:
             return "disarmed"
 
         # Analizar el estado de la alarma usando la misma lógica que el panel
-        internal = alarm_status.get("internal", {})
-        external = alarm_status.get("external", {})
         
         # Determinar el estado principal basado en prioridad
-        internal_day = internal.get("day", {}).get("status", False)
-        internal_night = internal.get("night", {}).get("status", False)
-        internal_total = internal.get("total", {}).get("status", False)
-        external_status = external.get("status", False)
+        internal_day, internal_night, internal_total, external_status = (
+            _alarm_modes(alarm_status)
+        )
         
         # Prioridad: Total > Night > Day > External > Disarmed
         if internal_total:
@@ -411,25 +445,27 @@ class MyVerisurePanelStateSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return {}
 
-        alarm_status = self.coordinator.data.get("alarm_status", {})
+        alarm_status = data.get("alarm_status", {})
         if not alarm_status:
             return {}
 
         # Los datos están en alarm_status.data
-        alarm_data = alarm_status.get("data", {})
-        internal = alarm_data.get("internal", {})
-        external = alarm_data.get("external", {})
-        
+        alarm_data = alarm_status.get("data") or _EMPTY
+        internal_day, internal_night, internal_total, external_status = (
+            _alarm_modes(alarm_data)
+        )
+
         return {
-            "internal_day_status": internal.get("day", {}).get("status", False),
-            "internal_night_status": internal.get("night", {}).get("status", False),
-            "internal_total_status": internal.get("total", {}).get("status", False),
-            "external_status": external.get("status", False),
-            "installation_id": self.config_entry.data.get("installation_id", "Unknown"),
-            "entity_id": f"alarm_control_panel.my_verisure_alarm_{self.config_entry.data.get('installation_id', 'unknown')}",
+            "internal_day_status": internal_day,
+            "internal_night_status": internal_night,
+            "internal_total_status": internal_total,
+            "external_status": external_status,
+            "installation_id": self._installation_id,
+            "entity_id": self._alarm_panel_entity_id,
         }
 
     @property
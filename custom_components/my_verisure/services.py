@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
 import voluptuous as vol
@@ -9,6 +11,10 @@ import voluptuous as vol
 from .core.const import DOMAIN, LOGGER
 from .coordinator import MyVerisureDataUpdateCoordinator
 
+# Key in hass.data[DOMAIN] indexing coordinators by installation id, so
+# service calls resolve their target without scanning every entry
+COORDINATORS_BY_INSTALLATION = "_by_installation"
+
 # Service schemas
 SERVICE_ARM_AWAY_SCHEMA = vol.Schema({
     vol.Required("installation_id"): cv.string,
@@ -35,11 +41,18 @@ SERVICE_REFRESH_CAMERA_IMAGES_SCHEMA = vol.Schema({
 })
 
 
+def _find_coordinator(
+    hass: HomeAssistant, installation_id: str
+) -> MyVerisureDataUpdateCoordinator | None:
+    """Return the coordinator registered for an installation, if any."""
+    coordinators = hass.data.get(DOMAIN, {}).get(COORDINATORS_BY_INSTALLATION, {})
+    return coordinators.get(installation_id)
+
 def _update_alarm_panel_state(coordinator: MyVerisureDataUpdateCoordinator) -> None:
     """Update the alarm control panel state via coordinator."""
     try:
         coordinator.clear_alarm_transition_state()
-        LOGGER.warning("Updated alarm control panel state via coordinator")
+        LOGGER.debug("Updated alarm control panel state via coordinator")
     except Exception as e:
         LOGGER.error("Error updating alarm control panel state: %s", e)
 
@@ -47,214 +60,96 @@ def _update_button_state(coordinator: MyVerisureDataUpdateCoordinator) -> None:
     """Update the button state via coordinator."""
     try:
         coordinator.clear_button_executing_state()
-        LOGGER.warning("Updated button state via coordinator")
+        LOGGER.debug("Updated button state via coordinator")
     except Exception as e:
         LOGGER.error("Error updating button state: %s", e)
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for My Verisure."""
     
-    async def async_arm_away_service(call: ServiceCall) -> None:
-        """Service to arm the alarm away."""
-        installation_id = call.data["installation_id"]
-        LOGGER.warning("Service arm_away called for installation %s", installation_id)
-        
-        # Find the coordinator for this installation
-        for entry_id, obj in hass.data[DOMAIN].items():
-            if not isinstance(obj, MyVerisureDataUpdateCoordinator):
-                continue
-            coordinator: MyVerisureDataUpdateCoordinator = obj
-
-            if coordinator.config_entry.data.get("installation_id") == installation_id:
-                LOGGER.warning("Found coordinator for installation %s, calling async_arm_away", installation_id)
-                try:
-                    result = await coordinator.async_arm_away()
-                    if result.success:
-                        LOGGER.warning("Alarm armed away successfully via service")
-                        # Update alarm control panel state
-                        _update_alarm_panel_state(coordinator)
-                    else:
-                        LOGGER.error("Failed to arm alarm away via service: %s", result.message)
-                        # Update alarm control panel state even on failure
-                        _update_alarm_panel_state(coordinator)
-                except Exception as e:
-                    LOGGER.error("Error arming alarm away via service: %s", e)
-                    # Update alarm control panel state on error
-                    _update_alarm_panel_state(coordinator)
-                break
-        else:
-            LOGGER.error("Installation %s not found", installation_id)
-
-    async def async_arm_home_service(call: ServiceCall) -> None:
-        """Service to arm the alarm home."""
-        installation_id = call.data["installation_id"]
-        LOGGER.warning("Service arm_home called for installation %s", installation_id)
-        
-        # Find the coordinator for this installation
-        for entry_id, obj in hass.data[DOMAIN].items():
-            if not isinstance(obj, MyVerisureDataUpdateCoordinator):
-                continue
-            coordinator: MyVerisureDataUpdateCoordinator = obj
-
-            if coordinator.config_entry.data.get("installation_id") == installation_id:
-                LOGGER.warning("Found coordinator for installation %s, calling async_arm_home", installation_id)
-                try:
-                    result = await coordinator.async_arm_home()
-                    if result.success:
-                        LOGGER.warning("Alarm armed home successfully via service")
-                        # Update alarm control panel state
-                        _update_alarm_panel_state(coordinator)
-                    else:
-                        LOGGER.error("Failed to arm alarm home via service: %s", result.message)
-                        # Update alarm control panel state even on failure
-                        _update_alarm_panel_state(coordinator)
-                except Exception as e:
-                    LOGGER.error("Error arming alarm home via service: %s", e)
-                    # Update alarm control panel state on error
-                    _update_alarm_panel_state(coordinator)
-                break
-        else:
-            LOGGER.error("Installation %s not found", installation_id)
+    def _make_alarm_service(
+        service: str, method_name: str, done: str, action: str
+    ) -> Callable[[ServiceCall], Awaitable[None]]:
+        """Build the handler for an alarm action service.
+
+        ``done`` and ``action`` are the past and progressive forms used in the
+        log lines, e.g. "armed away" / "arming alarm away".
+        """
+
+        async def async_alarm_service(call: ServiceCall) -> None:
+            installation_id = call.data["installation_id"]
+            LOGGER.debug("Service %s called for installation %s", service, installation_id)
+
+            coordinator = _find_coordinator(hass, installation_id)
+            if coordinator is None:
+                LOGGER.error("Installation %s not found", installation_id)
+                return
+
+            LOGGER.debug("Found coordinator for installation %s, calling %s", installation_id, method_name)
+            try:
+                result = await getattr(coordinator, method_name)()
+                if result.success:
+                    LOGGER.debug("Alarm %s successfully via service", done)
+                else:
+                    LOGGER.error("Failed %s via service: %s", action, result.message)
+            except Exception as e:
+                LOGGER.error("Error %s via service: %s", action, e)
+            # Update alarm control panel state on success, failure or error
+            _update_alarm_panel_state(coordinator)
+
+        return async_alarm_service
+
+    alarm_services = (
+        ("arm_away", "async_arm_away", "armed away", "arming alarm away", SERVICE_ARM_AWAY_SCHEMA),
+        ("arm_home", "async_arm_home", "armed home", "arming alarm home", SERVICE_ARM_HOME_SCHEMA),
+        ("arm_night", "async_arm_night", "armed night", "arming alarm night", SERVICE_ARM_NIGHT_SCHEMA),
+        ("disarm", "async_disarm", "disarmed", "disarming alarm", SERVICE_DISARM_SCHEMA),
+    )
 
-    async def async_arm_night_service(call: ServiceCall) -> None:
-        """Service to arm the alarm night."""
-        installation_id = call.data["installation_id"]
-        LOGGER.warning("Service arm_night called for installation %s", installation_id)
-        
-        # Find the coordinator for this installation
-        for entry_id, obj in hass.data[DOMAIN].items():
-            if not isinstance(obj, MyVerisureDataUpdateCoordinator):
-                continue
-            coordinator: MyVerisureDataUpdateCoordinator = obj
-            
-            if coordinator.config_entry.data.get("installation_id") == installation_id:
-                LOGGER.warning("Found coordinator for installation %s, calling async_arm_night", installation_id)
-                try:
-                    result = await coordinator.async_arm_night()
-                    if result.success:
-                        LOGGER.warning("Alarm armed night successfully via service")
-                        # Update alarm control panel state
-                        _update_alarm_panel_state(coordinator)
-                    else:
-                        LOGGER.error("Failed to arm alarm night via service: %s", result.message)
-                        # Update alarm control panel state even on failure
-                        _update_alarm_panel_state(coordinator)
-                except Exception as e:
-                    LOGGER.error("Error arming alarm night via service: %s", e)
-                    # Update alarm control panel state on error
-                    _update_alarm_panel_state(coordinator)
-                break
-        else:
-            LOGGER.error("Installation %s not found", installation_id)
-            
-    async def async_disarm_service(call: ServiceCall) -> None:
-        """Service to disarm the alarm."""
-        installation_id = call.data["installation_id"]
-        code = call.data.get("code")
-        LOGGER.warning("Service disarm called for installation %s", installation_id)
-        
-        # Find the coordinator for this installation
-        for entry_id, obj in hass.data[DOMAIN].items():
-            if not isinstance(obj, MyVerisureDataUpdateCoordinator):
-                continue
-            coordinator: MyVerisureDataUpdateCoordinator = obj
-            
-            if coordinator.config_entry.data.get("installation_id") == installation_id:
-                LOGGER.warning("Found coordinator for installation %s, calling async_disarm", installation_id)
-                try:
-                    result = await coordinator.async_disarm()
-                    if result.success:
-                        LOGGER.warning("Alarm disarmed successfully via service")
-                        # Update alarm control panel state
-                        _update_alarm_panel_state(coordinator)
-                    else:
-                        LOGGER.error("Failed to disarm alarm via service: %s", result.message)
-                        # Update alarm control panel state even on failure
-                        _update_alarm_panel_state(coordinator)
-                except Exception as e:
-                    LOGGER.error("Error disarming alarm via service: %s", e)
-                    # Update alarm control panel state on error
-                    _update_alarm_panel_state(coordinator)
-                break
-        else:
-            LOGGER.error("Installation %s not found", installation_id)
-            
     async def async_get_status_service(call: ServiceCall) -> None:
         """Service to get alarm status."""
         installation_id = call.data["installation_id"]
-        LOGGER.warning("Service get_status called for installation %s", installation_id)
+        LOGGER.debug("Service get_status called for installation %s", installation_id)
         
-        # Find the coordinator for this installation
-        for entry_id, obj in hass.data[DOMAIN].items():
-            if not isinstance(obj, MyVerisureDataUpdateCoordinator):
-                continue
-            coordinator: MyVerisureDataUpdateCoordinator = obj
-            if coordinator.config_entry.data.get("installation_id") == installation_id:
-                LOGGER.warning("Found coordinator for installation %s, calling async_request_refresh", installation_id)
-                try:
-                    await coordinator.async_request_refresh()
-                    LOGGER.warning("Alarm status refreshed via service")
-                except Exception as e:
-                    LOGGER.error("Error refreshing alarm status via service: %s", e)
-                break
-        else:
+        coordinator = _find_coordinator(hass, installation_id)
+        if coordinator is None:
             LOGGER.error("Installation %s not found", installation_id)
+            return
+
+        LOGGER.debug("Found coordinator for installation %s, scheduling async_request_refresh", installation_id)
+        # The entities pick up the new status through the coordinator
+        # listeners, so the service call does not wait for the API round trip
+        hass.async_create_task(coordinator.async_request_refresh())
 
     async def async_refresh_camera_images_service(call: ServiceCall) -> None:
         """Service to refresh camera images."""
         installation_id = call.data["installation_id"]
-        LOGGER.warning("Service refresh_camera_images called for installation %s", installation_id)
+        LOGGER.debug("Service refresh_camera_images called for installation %s", installation_id)
         
-        # Find the coordinator for this installation
-        for entry_id, obj in hass.data[DOMAIN].items():
-            if not isinstance(obj, MyVerisureDataUpdateCoordinator):
-                continue
-            coordinator: MyVerisureDataUpdateCoordinator = obj
-            
-            if coordinator.config_entry.data.get("installation_id") == installation_id:
-                LOGGER.warning("Found coordinator for installation %s, calling async_refresh_camera_images", installation_id)
-                try:
-                    await coordinator.async_refresh_camera_images()
-                    LOGGER.warning("Camera images refreshed via service")
-                    _update_button_state(coordinator)
-                except Exception as e:
-                    LOGGER.error("Error refreshing camera images via service: %s", e)
-                    _update_button_state(coordinator)
-                break
-        else:
+        coordinator = _find_coordinator(hass, installation_id)
+        if coordinator is None:
             LOGGER.error("Installation %s not found", installation_id)
+            return
+
+        LOGGER.debug("Found coordinator for installation %s, calling async_refresh_camera_images", installation_id)
+        try:
+            await coordinator.async_refresh_camera_images()
+            LOGGER.debug("Camera images refreshed via service")
+            _update_button_state(coordinator)
+        except Exception as e:
+            LOGGER.error("Error refreshing camera images via service: %s", e)
             _update_button_state(coordinator)
 
 
     # Register services
-    hass.services.async_register(
-        DOMAIN,
-        "arm_away",
-        async_arm_away_service,
-        schema=SERVICE_ARM_AWAY_SCHEMA,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        "arm_home",
-        async_arm_home_service,
-        schema=SERVICE_ARM_HOME_SCHEMA,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        "arm_night",
-        async_arm_night_service,
-        schema=SERVICE_ARM_NIGHT_SCHEMA,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        "disarm",
-        async_disarm_service,
-        schema=SERVICE_DISARM_SCHEMA,
-    )
-    
+    for service, method_name, done, action, schema in alarm_services:
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            _make_alarm_service(service, method_name, done, action),
+            schema=schema,
+        )
+
     hass.services.async_register(
         DOMAIN,
         "get_status",